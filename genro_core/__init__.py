@@ -15,12 +15,21 @@
 
 """Genro Core - Core utilities and decorators for Genro framework."""
 
-from .enablers import apiready, PublisherBridge
-from .micro_app import GenroMicroApplication
-from .micro_db import GenroMicroDb, Table
+import importlib
 
 __version__ = "0.1.0"
 
+# Public names mapped to the submodule defining them. They are imported on
+# first access (PEP 562), so `import genro_core` stays cheap for consumers
+# that only need part of the package.
+_LAZY_EXPORTS = {
+    "apiready": ".enablers",
+    "PublisherBridge": ".enablers",
+    "Table": ".micro_db",
+    "GenroMicroApplication": ".micro_app",
+    "GenroMicroDb": ".micro_db",
+}
+
 __all__ = [
     "apiready",
     "PublisherBridge",
@@ -28,3 +37,17 @@ __all__ = [
     "GenroMicroApplication",
     "GenroMicroDb",
 ]
+
+
+def __getattr__(name: str):
+    """Import public names lazily from their submodule."""
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -17,32 +17,117 @@
 
 import argparse
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from importlib.metadata import entry_points
 
 
-def discover_subcommands():
-    """Discover subcommands from installed packages using entry points.
+CLI_GROUP = "genro.cli"
 
-    Returns:
-        Dictionary mapping subcommand names to their handler functions.
+# EntryPoint objects per group, discovered once per process (not loaded)
+_entry_points = {}
+
+# (register_parser, execute) functions of loaded plugins, keyed by subcommand name
+_handlers = {}
+
+# Exceptions raised while loading plugins, keyed by subcommand name
+_load_errors = {}
+
+
+def _iter_entry_points(group=CLI_GROUP):
+    """Return the entry points registered under a group, keyed by name.
+
+    Distribution metadata is scanned only on the first call; the EntryPoint
+    objects are cached as-is, without importing the plugin modules.
     """
-    subcommands = {}
+    eps = _entry_points.get(group)
+    if eps is None:
+        # Selecting by group (Python 3.10+) avoids materializing every group
+        # of every installed distribution
+        eps = _entry_points[group] = {ep.name: ep for ep in entry_points(group=group)}
+    return eps
+
 
-    # Use entry_points() to discover genro CLI plugins
-    try:
-        # For Python 3.10+
-        eps = entry_points(group="genro.cli")
-    except TypeError:
-        # For Python 3.9
-        eps = entry_points().get("genro.cli", [])
+def _load(name):
+    """Load the plugin of a subcommand, importing it on first use.
 
-    for ep in eps:
+    Returns:
+        Tuple of the plugin's (register_parser, execute) functions. Each is
+        None if the plugin doesn't define it or failed to load; in the latter
+        case the exception is kept in ``_load_errors``.
+    """
+    functions = _handlers.get(name)
+    if functions is None:
+        ep = _iter_entry_points()[name]
         try:
-            subcommands[ep.name] = ep.load()
+            handler = ep.load()
         except Exception as e:
-            print(f"Warning: Failed to load subcommand '{ep.name}': {e}", file=sys.stderr)
+            _load_errors[name] = e
+            handler = None
+        functions = _handlers[name] = (
+            getattr(handler, "register_parser", None),
+            getattr(handler, "execute", None),
+        )
+    return functions
+
+
+def preload_subcommands(names=None):
+    """Load several subcommand plugins concurrently.
+
+    Importing plugins is mostly filesystem I/O, which releases the GIL, so
+    loading them in threads takes roughly as long as the slowest one. This is
+    meant for callers that need every plugin (e.g. documentation or shell
+    completion generators): `genro` itself only loads the dispatched one.
+
+    Args:
+        names: Subcommand names to load (default: all discovered subcommands)
+
+    Returns:
+        Dictionary mapping subcommand names to (register_parser, execute) tuples.
+    """
+    names = list(_iter_entry_points() if names is None else names)
+    pending = [name for name in names if name not in _handlers]
+    if len(pending) > 1:
+        with ThreadPoolExecutor(max_workers=min(8, len(pending))) as executor:
+            list(executor.map(_load, pending))
+    else:
+        for name in pending:
+            _load(name)
+    for name in pending:
+        error = _load_errors.get(name)
+        if error is not None:
+            print(f"Warning: Failed to load subcommand '{name}': {error}", file=sys.stderr)
+    return {name: _load(name) for name in names}
+
+
+def _selected_subcommand(argv):
+    """Return the subcommand named on the command line, if any."""
+    for arg in argv:
+        if not arg.startswith("-"):
+            return arg
+    return None
+
+
+def _format_commands(subcommands):
+    """Format the list of available subcommands shown by the global help."""
+    width = max(len(name) for name in subcommands)
+    lines = ["available commands:"]
+    for name, ep in subcommands.items():
+        lines.append(f"  {name.ljust(width)}  ({ep.value})")
+    lines.append("")
+    lines.append("Use 'genro <command> --help' for command-specific help")
+    return "\n".join(lines)
 
-    return subcommands
+
+def discover_subcommands():
+    """Discover subcommands from installed packages using entry points.
+
+    Plugins are not imported here: use ``_load()`` to get the handler of
+    the subcommand that is actually dispatched.
+
+    Returns:
+        Dictionary mapping subcommand names to their (not yet loaded) entry points.
+    """
+    return dict(_iter_entry_points())
 
 
 def main():
@@ -61,6 +146,20 @@ def main():
         print("\nNo subcommands available. Install genro packages (e.g., genro-db) to add functionality.")
         sys.exit(1)
 
+    selected = _selected_subcommand(sys.argv[1:])
+
+    if selected is None:
+        # No subcommand given (e.g. `genro --help`): list the available
+        # commands from their entry points, without importing any plugin
+        parser.epilog = _format_commands(subcommands)
+        parser.parse_args()
+        parser.print_help()
+        sys.exit(1)
+
+    if selected not in subcommands:
+        choices = ", ".join(repr(name) for name in subcommands)
+        parser.error(f"invalid choice: {selected!r} (choose from {choices})")
+
     # Add subcommand argument
     subparsers = parser.add_subparsers(
         title="available commands",
@@ -68,24 +167,25 @@ def main():
         help="Use 'genro <command> --help' for command-specific help",
     )
 
-    # Register each discovered subcommand
-    for name, handler in subcommands.items():
-        # Each handler should have a 'register_parser' function
-        if hasattr(handler, "register_parser"):
-            handler.register_parser(subparsers)
+    # Register only the subcommand being dispatched, so that a single plugin
+    # is imported per invocation
+    register_parser, execute = _load(selected)
+    if selected in _load_errors:
+        parser.error(f"failed to load subcommand {selected!r}: {_load_errors[selected]}")
+
+    # Each handler should have a 'register_parser' function
+    if register_parser is not None:
+        register_parser(subparsers)
+    else:
+        subparsers.add_parser(selected)
 
     # Parse arguments
     args = parser.parse_args()
 
-    if not args.subcommand:
-        parser.print_help()
-        sys.exit(1)
-
     # Execute the appropriate subcommand
-    handler = subcommands[args.subcommand]
-    if hasattr(handler, "execute"):
+    if execute is not None:
         try:
-            handler.execute(args)
+            execute(args)
         except Exception as e:
             print(f"Error: {e}", file=sys.stderr)
             sys.exit(1)
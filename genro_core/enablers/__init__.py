@@ -15,6 +15,6 @@
 
 """API Publisher enablers for Genro framework."""
 
-from .api_publisher_enabler import apiready, PublisherBridge
+from .api_publisher_enabler import apiready, get_api_metadata, ApiMetadata, PublisherBridge
 
-__all__ = ["apiready", "PublisherBridge"]
+__all__ = ["apiready", "get_api_metadata", "ApiMetadata", "PublisherBridge"]
@@ -35,10 +35,532 @@ Example:
 from __future__ import annotations
 
 import inspect
+import io
 import json
+import logging
 import sys
-from functools import wraps
-from typing import Any, Callable, get_type_hints, get_origin, get_args
+import weakref
+from dataclasses import dataclass, field, replace
+from enum import Enum
+from functools import lru_cache
+from operator import attrgetter
+from types import FunctionType, MappingProxyType, UnionType
+from typing import (
+    Annotated, Any, Callable, Iterator, Union, get_type_hints, get_origin, get_args
+)
+
+try:
+    import orjson
+except ImportError:  # optional: JSON output falls back to the json module
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class ApiMetadata:
+    """API metadata attached by @apiready to a decorated method as ``_api_metadata``.
+
+    Attributes:
+        request_fields: Tuple of (name, type, default) triples, with default
+            set to ... for required parameters
+        return_type: Return type
+        http_method: HTTP method (GET or POST)
+        endpoint_path: Relative path (defaults to function name)
+        docstring: Function documentation, cleaned with inspect.cleandoc()
+        transaction: Whether to run in a transaction
+        parameters: Type information of each request field, by name
+        return_type_info: Type information of the return type
+        rendered_parameters: Parameters rendered as a "name type[=default]"
+            list for the Markdown and HTML formatters
+        pending_hints: The decorated function while its forward references
+            can't be resolved, so that resolution is retried on
+            introspection; None once type hints are resolved
+    """
+
+    request_fields: tuple[tuple[str, Any, Any], ...]
+    return_type: Any
+    http_method: str
+    endpoint_path: str
+    docstring: str | None
+    transaction: bool = False
+    parameters: dict[str, dict] = field(default_factory=dict)
+    return_type_info: dict[str, Any] = field(default_factory=dict)
+    rendered_parameters: str = ""
+    pending_hints: Callable | None = field(default=None, repr=False, compare=False)
+
+
+@dataclass(frozen=True, slots=True)
+class Endpoint:
+    """Endpoint of an @apiready class, cached per class by PublisherBridge.
+
+    Attributes:
+        path: Relative path of the endpoint
+        method: HTTP method (GET or POST)
+        function_name: Name of the decorated method
+        parameters: Type information of each parameter, by name
+        return_type: Type information of the return type
+        transaction: Whether to run in a transaction
+        docstring: Cleaned docstring of the method, if any
+        rendered_parameters: Parameters rendered as a "name type[=default]" list
+    """
+
+    path: str
+    method: str
+    function_name: str
+    parameters: dict[str, dict]
+    return_type: dict[str, Any]
+    transaction: bool
+    docstring: str | None = None
+    rendered_parameters: str = ""
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the endpoint entry of an API structure dict."""
+        endpoint = {
+            "path": self.path,
+            "method": self.method,
+            "function_name": self.function_name,
+            "parameters": self.parameters,
+            "return_type": self.return_type,
+            "transaction": self.transaction
+        }
+
+        # Add docstring if available
+        if self.docstring:
+            endpoint["docstring"] = self.docstring
+
+        return endpoint
+
+
+# HTTP methods, interned and shared by the metadata of every decorated method
+_GET = sys.intern("GET")
+_POST = sys.intern("POST")
+
+# Method name prefixes of read-only operations, exposed as GET
+_GET_PREFIXES = ("read", "get", "list", "exists", "is_", "has_")
+
+# Names of a leading parameter that is not part of the API request
+_SKIP = frozenset(("self", "cls"))
+
+# Default of parameters without a default value
+_EMPTY = inspect.Parameter.empty
+
+# Default of getattr() telling a missing attribute from any stored value
+_MISSING = object()
+
+# Shared read-only stand-in for missing return_type/parameters in formatters
+_EMPTY_DICT = MappingProxyType({})
+
+# Class attributes that are methods, never @apiready manager instances
+_METHOD_TYPES = (FunctionType, classmethod, staticmethod)
+
+# Code flags of functions taking *args or **kwargs
+_CO_VARIADIC = inspect.CO_VARARGS | inspect.CO_VARKEYWORDS
+
+
+# Set once a decorated method has an Enum default that json.dumps() passes
+# to default=str. orjson writes Enum members by value without calling its
+# default, so JSON is then dumped with the json module, see _dump_json()
+_enum_defaults = False
+
+
+def _parameter_info(param_type: Any, default_value: Any) -> dict[str, Any]:
+    """Extract the information of a parameter from its type and default."""
+    global _enum_defaults
+
+    param_info = _extract_type_info(param_type)
+    param_info["required"] = default_value is ...
+
+    if default_value is not ...:
+        param_info["default"] = default_value
+        if isinstance(default_value, Enum) and not isinstance(
+            default_value, (str, int, float, list, tuple, dict)
+        ):
+            _enum_defaults = True
+
+    return param_info
+
+
+# Defaults whose equal values always render the same; floats are left out
+# (0.0 == -0.0) and typed caching keeps 1 and True apart
+_CACHEABLE_DEFAULTS = (type(None), bool, int, str, type(...))
+
+
+@lru_cache(maxsize=4096, typed=True)
+def _cached_parameter_info(param_type: Any, default_value: Any) -> tuple[tuple[str, Any], ...]:
+    """Return _parameter_info() as a tuple of items, cached per (type, default)."""
+    return tuple(_parameter_info(param_type, default_value).items())
+
+
+def _extract_parameter_info(request_fields: tuple[tuple, ...]) -> dict[str, dict]:
+    """Extract detailed parameter information from request fields."""
+    parameters = {}
+
+    for param_name, param_type, default_value in request_fields:
+        # Same types and simple defaults repeat across endpoints
+        if type(default_value) in _CACHEABLE_DEFAULTS:
+            try:
+                parameters[param_name] = dict(_cached_parameter_info(param_type, default_value))
+                continue
+            except TypeError:
+                # Unhashable type hint
+                pass
+        parameters[param_name] = _parameter_info(param_type, default_value)
+
+    return parameters
+
+
+def _union_type_name(type_hint: Any, origin: Any) -> str:
+    """Type name of Union[...] and X | Y: member names joined by " | "."""
+    type_names = []
+    for arg in get_args(type_hint):
+        if arg is type(None):
+            type_names.append("None")
+        else:
+            name = getattr(arg, '__name__', _MISSING)
+            type_names.append(str(arg) if name is _MISSING else name)
+    return " | ".join(type_names)
+
+
+def _generic_type_name(type_hint: Any, origin: Any) -> str:
+    """Type name of generic types (list, dict, etc.): origin[arg, ...]."""
+    args = get_args(type_hint)
+    if not args:
+        return origin.__name__
+
+    arg_names = []
+    for arg in args:
+        name = getattr(arg, '__name__', _MISSING)
+        arg_names.append(str(arg) if name is _MISSING else name)
+    return f"{origin.__name__}[{', '.join(arg_names)}]"
+
+
+# Type name handlers by get_origin(), other named origins are generics
+_ORIGIN_HANDLERS = {
+    Union: _union_type_name,
+    UnionType: _union_type_name,
+}
+
+
+def _type_name(type_hint: Any, origin: Any) -> str:
+    """Return the display name of a type hint that is not Annotated."""
+    # Handle None type
+    if type_hint is type(None):
+        return "None"
+
+    # Handle string forward references
+    if isinstance(type_hint, str):
+        return type_hint
+
+    # Dispatch parametrized types (Union, generics) on their origin
+    if origin is not None:
+        handler = _ORIGIN_HANDLERS.get(origin)
+        if handler is not None:
+            return handler(type_hint, origin)
+        if hasattr(origin, '__name__'):
+            return _generic_type_name(type_hint, origin)
+
+    # Handle simple types with __name__
+    name = getattr(type_hint, '__name__', _MISSING)
+    if name is not _MISSING:
+        return name
+
+    # Fallback: convert to string
+    return str(type_hint)
+
+
+def _type_info(type_hint: Any) -> dict[str, Any]:
+    """Extract information from a type hint, uncached."""
+    # Peel Annotated wrappers in place: the first string metadata of the
+    # outermost wrapper having one is the description
+    origin = get_origin(type_hint)
+    description = None
+    while origin is Annotated:
+        args = get_args(type_hint)
+        if description is None:
+            description = next((meta for meta in args[1:] if isinstance(meta, str)), None)
+        type_hint = args[0]
+        origin = get_origin(type_hint)
+
+    info = {"type": _type_name(type_hint, origin)}
+    if description is not None:
+        info["description"] = description
+    return info
+
+
+@lru_cache(maxsize=4096)
+def _cached_type_info(type_hint: Any) -> tuple[tuple[str, Any], ...]:
+    """Return _type_info() as a tuple of items, cached per type hint."""
+    return tuple(_type_info(type_hint).items())
+
+
+# Names of the builtin types most hints are, resolved with a single lookup
+_BUILTIN_TYPE_NAMES = {
+    str: "str",
+    int: "int",
+    bool: "bool",
+    float: "float",
+    bytes: "bytes",
+    type(None): "None",
+}
+
+
+def _extract_type_info(type_hint: Any) -> dict[str, Any]:
+    """Extract information from a type hint.
+
+    The same hints (str, int, list[str]...) repeat across endpoints, so the
+    result is cached per hint; callers get their own dict.
+    """
+    name = _BUILTIN_TYPE_NAMES.get(type_hint) if type(type_hint) is type else None
+    if name is not None:
+        return {"type": name}
+    try:
+        return dict(_cached_type_info(type_hint))
+    except TypeError:
+        # Unhashable hint, e.g. Annotated with list metadata
+        return _type_info(type_hint)
+
+
+def _fmt_default(default: Any) -> str:
+    """Render a parameter default; "" (no default recorded) stays empty."""
+    if default == "":
+        return ""
+    return str(default)
+
+
+def _render_param_list(params: dict[str, dict]) -> str:
+    """Render endpoint parameters as a comma-separated "name type[=default]" list."""
+    return ", ".join(
+        f"{name} {info.get('type', 'Any')}" if info.get("required", False)
+        else f"{name} {info.get('type', 'Any')}={_fmt_default(info.get('default', ''))}"
+        for name, info in params.items()
+    )
+
+
+# inspect.cleandoc() cached per docstring text: method docstrings are cleaned
+# at decoration, class docstrings on every structure build
+_cleandoc = lru_cache(maxsize=1024)(inspect.cleandoc)
+
+
+@lru_cache(maxsize=None)
+def _cached_type_hints(func: Callable) -> dict[str, Any]:
+    """Return get_type_hints() of func, cached per function.
+
+    Annotations are fixed once a function is defined. Failures are not
+    cached (lru_cache doesn't store exceptions), so unresolved forward
+    references are retried on the next call.
+    """
+    return get_type_hints(func, include_extras=True)
+
+
+@lru_cache(maxsize=None)
+def _cached_signature(func: Callable) -> inspect.Signature:
+    """Return inspect.signature() of func, cached per callable."""
+    return inspect.signature(func)
+
+
+def _parameter_defaults(f: Callable) -> list[tuple[str, Any]]:
+    """Return the (name, default) pairs of the parameters of f.
+
+    Plain functions are read straight from their code object, without
+    building an inspect.Signature. Anything else (partials, builtins,
+    wrappers exposing __wrapped__ or __signature__, functions with *args or
+    **kwargs) goes through inspect.signature().
+
+    Args:
+        f: Callable to inspect
+
+    Returns:
+        List of (name, default) pairs in declaration order, with default set
+        to inspect.Parameter.empty for parameters without a default
+    """
+    code = getattr(f, "__code__", None)
+    if (
+        not inspect.isfunction(f)
+        or code.co_flags & _CO_VARIADIC
+        or hasattr(f, "__wrapped__")
+        or hasattr(f, "__signature__")
+    ):
+        return [
+            (param.name, param.default)
+            for param in _cached_signature(f).parameters.values()
+        ]
+
+    argcount = code.co_argcount
+    defaults = f.__defaults__ or ()
+    kwdefaults = f.__kwdefaults__ or {}
+
+    # Positional defaults are aligned to the tail of the positional names
+    first_default = argcount - len(defaults)
+    pairs = [
+        (name, defaults[i - first_default] if i >= first_default else _EMPTY)
+        for i, name in enumerate(code.co_varnames[:argcount])
+    ]
+    pairs.extend(
+        (name, kwdefaults.get(name, _EMPTY))
+        for name in code.co_varnames[argcount:argcount + code.co_kwonlyargcount]
+    )
+    return pairs
+
+
+# Classes found by scanning module namespaces, keyed by module name, with
+# the scanned module, the size of its namespace and the names the classes
+# were found under
+_module_apiready_cache: dict[
+    str, tuple[weakref.ref, int, tuple[str, ...], tuple[type, ...]]
+] = {}
+
+
+def _decorate_class(
+    cls: type,
+    path: str | None,
+    additem: str | None,
+    delitem: str | None,
+    subcomponents: tuple[str, ...] | None,
+) -> type:
+    """Apply @apiready to a class - sets _api_base_path and CRUD metadata."""
+    if path is None:
+        raise ValueError(
+            f"@apiready on class {cls.__name__} requires path parameter: "
+            f"@apiready(path='/your-path')"
+        )
+    cls._api_base_path = path
+
+    # Store CRUD metadata if provided
+    if additem is not None:
+        cls._api_additem = additem
+    if delitem is not None:
+        cls._api_delitem = delitem
+
+    # Store the declared manager attributes, walked instead of dir()
+    if subcomponents is not None:
+        cls._api_subcomponents = tuple(subcomponents)
+
+    # Rescan the module on next eager introspection: the class may rebind
+    # an existing name, which the scan cache does not notice by itself
+    _module_apiready_cache.pop(cls.__module__, None)
+
+    return cls
+
+
+def _decorate_method(
+    f: Callable, path: str | None, method: str | None, transaction: bool
+) -> Callable:
+    """Apply @apiready to a method - creates API metadata."""
+    # Annotations that are already real types need no evaluation: only
+    # string annotations go through get_type_hints()
+    pending_hints = None
+    if not getattr(f, "__annotations__", None):
+        # Nothing to resolve, all types default to Any
+        type_hints = {}
+    else:
+        annotations = inspect.get_annotations(f, eval_str=False)
+        if any(isinstance(hint, str) for hint in annotations.values()):
+            try:
+                type_hints = _cached_type_hints(f)
+            except NameError:
+                # Forward references can't be resolved yet, use raw annotations
+                # until _resolve_pending_hints() succeeds
+                type_hints = annotations
+                pending_hints = f
+        else:
+            # Same normalization get_type_hints() applies to None annotations
+            type_hints = {
+                name: type(None) if hint is None else hint
+                for name, hint in annotations.items()
+            }
+
+    # Extract return type
+    return_type = type_hints.get("return", Any)
+
+    # Build request fields from parameters (skip 'self' and 'cls')
+    # Decided once on the first parameter, the loop below has no branch
+    params = _parameter_defaults(f)
+    if params and params[0][0] in _SKIP:
+        params = params[1:]
+
+    request_fields = []
+    for name, default in params:
+        # Get type from type hints, default to Any if not specified
+        param_type = type_hints.get(name, Any)
+
+        # Required parameters are marked with ... as default
+        if default is _EMPTY:
+            default = ...
+        request_fields.append((name, param_type, default))
+
+    # Infer HTTP method if not provided
+    if method is not None:
+        http_method = sys.intern(method)
+    else:
+        # GET for read-only operations, POST for mutations
+        http_method = _GET if f.__name__.startswith(_GET_PREFIXES) else _POST
+
+    # Determine endpoint path (relative to class base path)
+    endpoint_path = path if path is not None else "/" + f.__name__
+    if not endpoint_path.startswith("/"):
+        endpoint_path = "/" + endpoint_path
+    # Interned: the same path is shared across classes and overrides
+    endpoint_path = sys.intern(endpoint_path)
+
+    # Type information is fixed by the annotations, so it is extracted once
+    # here instead of on every get_api_structure() call
+    request_fields = tuple(request_fields)
+    parameters = _extract_parameter_info(request_fields)
+    metadata = ApiMetadata(
+        request_fields=request_fields,
+        return_type=return_type,
+        http_method=http_method,
+        endpoint_path=endpoint_path,
+        docstring=f.__doc__ and _cleandoc(f.__doc__),
+        transaction=transaction,
+        parameters=parameters,
+        return_type_info=_extract_type_info(return_type),
+        rendered_parameters=_render_param_list(parameters),
+        pending_hints=pending_hints,
+    )
+
+    # The function itself is returned: a wrapper would only add a call frame
+    f._api_metadata = metadata
+    return f
+
+
+def _resolve_pending_hints(metadata: ApiMetadata) -> ApiMetadata:
+    """Retry resolving type hints that had forward references at decoration.
+
+    On success the metadata is rebuilt with the resolved types and stored
+    back on the decorated function, so resolution happens once; while
+    names are still undefined the metadata is returned unchanged.
+
+    Args:
+        metadata: ApiMetadata with pending_hints set
+
+    Returns:
+        The resolved ApiMetadata, or metadata itself
+    """
+    f = metadata.pending_hints
+    try:
+        type_hints = _cached_type_hints(f)
+    except NameError:
+        return metadata
+
+    request_fields = tuple(
+        (name, type_hints.get(name, Any), default)
+        for name, _, default in metadata.request_fields
+    )
+    return_type = type_hints.get("return", Any)
+    parameters = _extract_parameter_info(request_fields)
+    resolved = replace(
+        metadata,
+        request_fields=request_fields,
+        return_type=return_type,
+        parameters=parameters,
+        return_type_info=_extract_type_info(return_type),
+        rendered_parameters=_render_param_list(parameters),
+        pending_hints=None,
+    )
+    f._api_metadata = resolved
+    return resolved
 
 
 def apiready(
@@ -48,7 +570,8 @@ def apiready(
     method: str | None = None,
     additem: str | None = None,
     delitem: str | None = None,
-    transaction: bool = False
+    transaction: bool = False,
+    subcomponents: tuple[str, ...] | None = None
 ) -> Callable:
     """Decorator to mark classes and methods as API-ready.
 
@@ -72,16 +595,15 @@ def apiready(
         delitem: Optional name of the method that deletes items (for CRUD interfaces)
         transaction: If True, method will be executed within a database transaction
                     (default: False). Mutations (POST) typically need transaction=True.
+        subcomponents: Optional names of the instance attributes holding @apiready
+                    managers (for classes). When given, eager introspection of an
+                    instance reads only these attributes instead of walking dir().
 
     Returns:
         For classes: Class with _api_base_path attribute set
-        For methods: Decorated function with _api_metadata attribute containing:
-            - request_fields: Parameter types and defaults
-            - return_type: Return type
-            - http_method: HTTP method (GET or POST)
-            - endpoint_path: Relative path (defaults to function name)
-            - docstring: Function documentation
-            - transaction: Whether to run in a transaction
+        For methods: The function itself, with an ApiMetadata instance as
+            _api_metadata attribute (request fields, return type, HTTP method,
+            endpoint path, docstring and transaction flag)
 
     Usage:
         @apiready(path="/books")
@@ -93,107 +615,401 @@ def apiready(
             def add(self, title: str, author: str) -> dict: ...
     """
 
-    def class_decorator(cls: type) -> type:
-        """Decorator for classes - sets _api_base_path and CRUD metadata."""
-        if path is None:
-            raise ValueError(
-                f"@apiready on class {cls.__name__} requires path parameter: "
-                f"@apiready(path='/your-path')"
-            )
-        cls._api_base_path = path
-
-        # Store CRUD metadata if provided
-        if additem is not None:
-            cls._api_additem = additem
-        if delitem is not None:
-            cls._api_delitem = delitem
-
-        return cls
-
-    def method_decorator(f: Callable) -> Callable:
-        """Decorator for methods - creates API metadata."""
-        # Get function signature and type hints
-        sig = inspect.signature(f)
-        try:
-            type_hints = get_type_hints(f, include_extras=True)
-        except NameError:
-            # Forward references can't be resolved yet, use raw annotations
-            type_hints = f.__annotations__.copy() if hasattr(f, '__annotations__') else {}
-
-        # Extract return type
-        return_type = type_hints.get("return", Any)
-
-        # Build request fields from parameters (skip 'self' and 'cls')
-        request_fields = {}
-        for param_name, param in sig.parameters.items():
-            if param_name in ("self", "cls"):
-                continue
-
-            # Get type from type hints, default to Any if not specified
-            param_type = type_hints.get(param_name, Any)
-
-            # Handle default values
-            if param.default is inspect.Parameter.empty:
-                # Required parameter
-                request_fields[param_name] = (param_type, ...)
-            else:
-                # Optional parameter with default
-                request_fields[param_name] = (param_type, param.default)
-
-        # Infer HTTP method if not provided
-        http_method = method
-        if http_method is None:
-            func_name = f.__name__
-            # GET for read-only operations
-            if any(
-                func_name.startswith(prefix)
-                for prefix in ["read", "get", "list", "exists", "is_", "has_"]
-            ):
-                http_method = "GET"
-            else:
-                # POST for mutations
-                http_method = "POST"
-
-        # Determine endpoint path (relative to class base path)
-        endpoint_path = path if path is not None else f"/{f.__name__}"
-        if not endpoint_path.startswith("/"):
-            endpoint_path = f"/{endpoint_path}"
-
-        # Store metadata on the function
-        f._api_metadata = {
-            "request_fields": request_fields,
-            "return_type": return_type,
-            "http_method": http_method,
-            "endpoint_path": endpoint_path,
-            "docstring": f.__doc__,
-            "transaction": transaction,
-        }
-
-        # Preserve original function behavior
-        @wraps(f)
-        def wrapper(*args, **kwargs):
-            return f(*args, **kwargs)
-
-        # Copy metadata to wrapper
-        wrapper._api_metadata = f._api_metadata
-
-        return wrapper
-
     # Determine if decorating a class or a method/function
     if target is None:
         # Called with arguments: @apiready(path="/books") or @apiready(method='POST')
         def deferred_decorator(actual_target):
             if inspect.isclass(actual_target):
-                return class_decorator(actual_target)
+                return _decorate_class(actual_target, path, additem, delitem, subcomponents)
             else:
-                return method_decorator(actual_target)
+                return _decorate_method(actual_target, path, method, transaction)
         return deferred_decorator
     else:
         # Called without arguments: @apiready
         if inspect.isclass(target):
-            return class_decorator(target)
+            return _decorate_class(target, path, additem, delitem, subcomponents)
         else:
-            return method_decorator(target)
+            return _decorate_method(target, path, method, transaction)
+
+
+def get_api_metadata(obj: Any) -> ApiMetadata | None:
+    """Return the @apiready metadata of a function, looking through wrappers.
+
+    Decorators applied on top of @apiready usually copy ``_api_metadata``
+    (functools.wraps does); when they don't, the ``__wrapped__`` chain is
+    followed until a decorated function is found.
+
+    Args:
+        obj: Function, possibly wrapped by other decorators
+
+    Returns:
+        ApiMetadata instance, or None if obj is not @apiready decorated
+
+    Example:
+        metadata = get_api_metadata(BookTable.insert)
+        if metadata is not None:
+            print(metadata.http_method, metadata.endpoint_path)
+    """
+    while obj is not None:
+        metadata = getattr(obj, "_api_metadata", None)
+        if metadata is not None:
+            return metadata
+        obj = getattr(obj, "__wrapped__", None)
+    return None
+
+
+# API structure dicts of classes by eager flag, dropped with the class. Each
+# is kept with the module classes its children were built from
+_structure_cache: weakref.WeakKeyDictionary[type, dict[bool, tuple[tuple[type, ...], dict]]] = (
+    weakref.WeakKeyDictionary()
+)
+
+# Formatted API structures of classes by (eager, mode), dropped with the
+# class. Each is kept with the structure dict it was formatted from
+_output_cache: weakref.WeakKeyDictionary[type, dict[tuple[bool, str], tuple[dict, str | bytes]]] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+# Classes holding _api_sorted_endpoints and _api_structure_cached attributes,
+# reset by clear_cache()
+_sorted_endpoint_classes: weakref.WeakSet[type] = weakref.WeakSet()
+
+
+def _sorted_endpoints(target: type) -> tuple[Endpoint, ...]:
+    """Return the endpoints of an @apiready class, sorted by path.
+
+    Endpoint paths are fixed at decoration time, so the sorted tuple is
+    computed once and stored on the class as ``_api_sorted_endpoints``.
+    It is looked up in the class __dict__ only, subclasses get their own.
+    PublisherBridge.clear_cache() drops it, e.g. after ``_api_metadata``
+    has been changed.
+
+    Args:
+        target: @apiready decorated class
+
+    Returns:
+        Tuple of Endpoint instances, sorted by (path, function_name)
+    """
+    endpoints = target.__dict__.get("_api_sorted_endpoints")
+    if endpoints is not None:
+        return endpoints
+
+    # Walk the class dicts along the MRO to find decorated methods: unlike
+    # inspect.getmembers() this neither sorts nor goes through descriptors.
+    # The first class defining a name shadows the others
+    found = []
+    seen = set()
+    pending = False
+    for klass in target.__mro__:
+        if klass is object:
+            continue
+        for name, method in klass.__dict__.items():
+            if name in seen:
+                continue
+            seen.add(name)
+
+            # Only functions are endpoints, as with getmembers(isfunction):
+            # staticmethods expose theirs, classmethods and other callables
+            # are skipped
+            if isinstance(method, staticmethod):
+                method = method.__func__
+            if not isinstance(method, FunctionType):
+                continue
+
+            # Check if method has API metadata
+            metadata = get_api_metadata(method)
+            if metadata is None:
+                continue
+            if metadata.pending_hints is not None:
+                metadata = _resolve_pending_hints(metadata)
+                if metadata.pending_hints is not None:
+                    pending = True
+
+            # Build endpoint entry from the type information extracted at
+            # decoration time
+            found.append(Endpoint(
+                path=metadata.endpoint_path,
+                method=metadata.http_method,
+                function_name=name,
+                parameters=metadata.parameters,
+                return_type=metadata.return_type_info,
+                transaction=metadata.transaction,
+                docstring=metadata.docstring,
+                rendered_parameters=metadata.rendered_parameters,
+            ))
+
+    # Sort endpoints by path for consistent output, ties by name
+    endpoints = tuple(sorted(found, key=attrgetter("path", "function_name")))
+
+    # Endpoints with unresolved forward references are not stored, the
+    # next introspection retries them
+    if not pending:
+        target._api_sorted_endpoints = endpoints
+        _sorted_endpoint_classes.add(target)
+    return endpoints
+
+
+def _public_attributes(instance: object) -> Iterator[tuple[str, Any]]:
+    """Yield the public attributes of an instance, sorted by name as dir() lists them.
+
+    Values stored in the instance __dict__ are read directly, without going
+    through descriptors. Methods of the class are skipped without being
+    bound: they can't be @apiready managers. Other class attributes, such as
+    properties, are read with getattr(); those raising are skipped.
+
+    Args:
+        instance: Object whose attributes are walked
+
+    Yields:
+        (name, value) pairs
+    """
+    cls = type(instance)
+    instance_dict = getattr(instance, '__dict__', {})
+    for name in dir(instance):
+        if name.startswith('_'):
+            continue
+        if name in instance_dict:
+            yield name, instance_dict[name]
+            continue
+        if isinstance(inspect.getattr_static(cls, name, None), _METHOD_TYPES):
+            continue
+        try:
+            yield name, getattr(instance, name)
+        except Exception:
+            logger.debug("Cannot read attribute %r of %r", name, instance, exc_info=True)
+
+
+def _module_apiready_classes(module_name: str) -> tuple[type, ...]:
+    """Return the @apiready classes of a module.
+
+    Every class in the module namespace with an _api_base_path is included,
+    in namespace order: classes decorated there, undecorated subclasses
+    inheriting the attribute and decorated classes imported from other
+    modules. The classes of the namespace are cached until the module is
+    imported again or reloaded, names are added to or removed from it, or a
+    class of the module is decorated; _api_base_path is checked on each
+    call, as Table.__init__ sets it on classes already in the namespace.
+
+    Args:
+        module_name: Name of the module, as in a class __module__
+
+    Returns:
+        Tuple of classes with an _api_base_path attribute
+    """
+    module = sys.modules.get(module_name)
+    if module is None:
+        return ()
+
+    namespace = vars(module)
+
+    # The scan is repeated when the module is imported again or reloaded,
+    # or when names are added to or removed from it
+    cached = _module_apiready_cache.get(module_name)
+    if cached is not None:
+        module_ref, size, names, classes = cached
+        if not (
+            module_ref() is module
+            and size == len(namespace)
+            and all(namespace.get(name) is cls for name, cls in zip(names, classes))
+        ):
+            cached = None
+
+    if cached is None:
+        found = [(name, obj) for name, obj in list(namespace.items()) if inspect.isclass(obj)]
+        names = tuple(name for name, _ in found)
+        classes = tuple(obj for _, obj in found)
+        _module_apiready_cache[module_name] = (
+            weakref.ref(module), len(namespace), names, classes
+        )
+
+    return tuple(cls for cls in classes if hasattr(cls, '_api_base_path'))
+
+
+def _base_structure(target: type) -> dict:
+    """Return the API structure dict of an @apiready class, without children.
+
+    It is computed on first introspection, not when @apiready is applied:
+    class attributes such as _api_additem may be set afterwards, e.g. by
+    Table.__init__. It is stored as ``_api_structure_cached``, each class
+    gets its own. PublisherBridge.clear_cache() drops it.
+
+    Args:
+        target: Class to introspect
+
+    Returns:
+        API structure dict, shared and read-only
+
+    Raises:
+        ValueError: If target is not decorated with @apiready
+    """
+    structure = target.__dict__.get("_api_structure_cached")
+    if structure is not None:
+        return structure
+
+    # Check if class is decorated with @apiready
+    base_path = getattr(target, '_api_base_path', _MISSING)
+    if base_path is _MISSING:
+        raise ValueError(
+            f"Class {target.__name__} is not decorated with @apiready. "
+            "Only @apiready decorated classes can be introspected."
+        )
+
+    # Collect structure
+    structure = {
+        "class_name": target.__name__,
+        "base_path": base_path,
+        "endpoints": []
+    }
+
+    # Add CRUD metadata if available
+    additem = getattr(target, '_api_additem', _MISSING)
+    if additem is not _MISSING:
+        structure["additem"] = additem
+    delitem = getattr(target, '_api_delitem', _MISSING)
+    if delitem is not _MISSING:
+        structure["delitem"] = delitem
+
+    # Add class docstring if available
+    if target.__doc__:
+        structure["docstring"] = _cleandoc(target.__doc__)
+
+    # Endpoints are cached per class, structures get their own dicts
+    structure["endpoints"] = [endpoint.as_dict() for endpoint in _sorted_endpoints(target)]
+
+    # Stored only once endpoints are final, see _sorted_endpoints()
+    if "_api_sorted_endpoints" in target.__dict__:
+        target._api_structure_cached = structure
+    return structure
+
+
+def _copy_structure(data: Any) -> Any:
+    """Copy the dicts and lists of an API structure, sharing the other values."""
+    if isinstance(data, dict):
+        return {key: _copy_structure(value) for key, value in data.items()}
+    if isinstance(data, list):
+        return [_copy_structure(value) for value in data]
+    return data
+
+
+# orjson options giving the output of json.dumps(indent=2, default=str):
+# dates, times and dataclasses go to default=str instead of being
+# serialized natively
+_ORJSON_OPTIONS = (
+    orjson.OPT_INDENT_2
+    | orjson.OPT_NON_STR_KEYS
+    | orjson.OPT_PASSTHROUGH_DATETIME
+    | orjson.OPT_PASSTHROUGH_DATACLASS
+) if orjson is not None else 0
+
+
+def _dump_json(data: Any) -> str:
+    """Dump API structures as JSON indented by 2 spaces.
+
+    orjson is used when installed. Values that are not JSON types are
+    rendered with str(), as json.dumps(default=str) does. Non-ASCII text is
+    written as UTF-8 rather than as \\u escapes. The json module is the
+    fallback, also for data orjson rejects (e.g. integers over 64 bits) and
+    once Enum defaults have been decorated, see _enum_defaults.
+    """
+    if orjson is not None and not _enum_defaults:
+        try:
+            return orjson.dumps(data, default=str, option=_ORJSON_OPTIONS).decode()
+        except TypeError:
+            pass
+    return json.dumps(data, indent=2, default=str)
+
+
+def _dump_json_bytes(data: Any) -> bytes:
+    """Dump API structures as UTF-8 encoded JSON, see _dump_json().
+
+    orjson produces bytes natively, so no str is built and encoded.
+    """
+    if orjson is not None and not _enum_defaults:
+        try:
+            return orjson.dumps(data, default=str, option=_ORJSON_OPTIONS)
+        except TypeError:
+            pass
+    return json.dumps(data, indent=2, default=str).encode()
+
+
+@lru_cache(maxsize=None)
+def _yaml_dumper() -> type:
+    """Return the Dumper class used for YAML output, built once.
+
+    It is the libyaml-based CSafeDumper when PyYAML was built with it, the
+    pure-Python SafeDumper otherwise. Cached structures are shared between
+    parents and children, so aliases are disabled: otherwise PyYAML would
+    render them as &id/*id references. Values YAML can't represent safely
+    are written with str(), as in JSON output.
+    """
+    try:
+        import yaml
+    except ImportError:
+        raise ImportError(
+            "PyYAML is required for YAML output. "
+            "Install it with: pip install pyyaml"
+        )
+
+    class NoAliasDumper(getattr(yaml, "CSafeDumper", yaml.SafeDumper)):
+        def ignore_aliases(self, data):
+            return True
+
+    NoAliasDumper.add_multi_representer(
+        object, lambda dumper, data: dumper.represent_str(str(data))
+    )
+    return NoAliasDumper
+
+
+def _dump_yaml(data: Any, encoding: str | None = None) -> str | bytes:
+    """Dump API structures as YAML, as bytes if an encoding is given."""
+    dumper = _yaml_dumper()
+    import yaml  # already imported by _yaml_dumper()
+
+    return yaml.dump(
+        data, Dumper=dumper, encoding=encoding, default_flow_style=False, sort_keys=False
+    )
+
+
+# Static parts of the HTML documents; _HTML_HEAD takes the page title
+_HTML_HEAD = (
+    "<!DOCTYPE html>\n"
+    "<html>\n"
+    "<head>\n"
+    "<title>{title}</title>\n"
+    "<style>\n"
+    "body {{ font-family: monospace; margin: 20px; }}\n"
+    "h3 {{ color: #333; font-size: 1.5em; font-weight: bold; margin-top: 20px; border-bottom: 2px solid #333; padding-bottom: 5px; }}\n"
+    ".endpoint {{ margin-bottom: 20px; }}\n"
+    ".name {{ font-weight: bold; }}\n"
+    ".command {{ margin-left: 20px; line-height: 1.2; }}\n"
+    ".params {{ margin-left: 20px; line-height: 1.2; }}\n"
+    "</style>\n"
+    "</head>\n"
+    "<body>\n"
+)
+
+_HTML_MULTI_HEAD = (
+    "<!DOCTYPE html>\n"
+    "<html>\n"
+    "<head>\n"
+    "<title>API Documentation</title>\n"
+    "<style>\n"
+    "body { font-family: monospace; margin: 20px; }\n"
+    "h2 { color: #333; border-bottom: 2px solid #333; padding-bottom: 5px; }\n"
+    "h3 { color: #555; }\n"
+    ".class-section { margin-bottom: 40px; }\n"
+    ".endpoint { margin-bottom: 20px; }\n"
+    ".name { font-weight: bold; }\n"
+    ".command { margin-left: 20px; line-height: 1.2; }\n"
+    ".params { margin-left: 20px; line-height: 1.2; }\n"
+    "</style>\n"
+    "</head>\n"
+    "<body>\n"
+    "<h2>API Documentation</h2>\n"
+)
+
+_HTML_FOOT = "</body>\n</html>"
 
 
 class PublisherBridge:
@@ -223,143 +1039,221 @@ class PublisherBridge:
         *,
         eager: bool = True,
         mode: str = "json"
-    ) -> str | dict:
+    ) -> str | bytes | dict:
         """Extract API structure from an @apiready decorated class.
 
         Args:
             target: Class or instance to introspect
             eager: If True, recursively collect all API metadata (default: True)
-            mode: Output format - "json" (default), "yaml", "markdown"/"md", or "html"
+            mode: Output format - "json" (default), "yaml", "markdown"/"md", or "html";
+                "json-bytes" and "yaml-bytes" return UTF-8 encoded JSON or YAML
 
         Returns:
-            API structure as JSON string, YAML string, Markdown string, HTML string, or dict
+            API structure as JSON string, YAML string, Markdown string, HTML string,
+            bytes, or dict
+
+        Structures of classes are cached per (class, eager), and their
+        formatted output per (class, eager, mode); eager ones are rebuilt
+        when the @apiready classes of the module change. Instances reuse the
+        structure of their class, only their attributes are walked on each
+        call in eager mode. Dicts returned in "dict" mode are copies, the
+        caller may modify them. Use clear_cache() if decorated classes are
+        redefined.
 
         Example:
             structure = app.bridge.get_api_structure(BookTable, mode="json")
         """
-        # Keep reference to instance for eager mode
-        instance = None if inspect.isclass(target) else target
-
-        # Get the class if instance was passed
         if not inspect.isclass(target):
-            target = target.__class__
-
-        # Check if class is decorated with @apiready
-        if not hasattr(target, '_api_base_path'):
-            raise ValueError(
-                f"Class {target.__name__} is not decorated with @apiready. "
-                "Only @apiready decorated classes can be introspected."
-            )
+            structure = self._instance_structure(target, eager)
+            return self._format_structure(structure, mode, target.__class__)
+
+        structure = self._class_structure(target, eager)
+        outputs = _output_cache.get(target)
+        if outputs is None:
+            outputs = _output_cache[target] = {}
+        key = (eager, mode.lower())
+        cached = outputs.get(key)
+        if cached is not None and cached[0] is structure:
+            return cached[1]
+
+        output = self._format_structure(structure, mode, target)
+        # Dicts are copies, see _format_structure(). Not cached while forward
+        # references are pending, see _sorted_endpoints()
+        if not isinstance(output, dict) and "_api_sorted_endpoints" in target.__dict__:
+            outputs[key] = (structure, output)
+        return output
+
+    def _structure(self, target: type | object, eager: bool) -> dict:
+        """Return the API structure dict of a class or instance, shared with the cache."""
+        if inspect.isclass(target):
+            return self._class_structure(target, eager)
+        return self._instance_structure(target, eager)
 
-        # Collect structure
-        structure = {
-            "class_name": target.__name__,
-            "base_path": target._api_base_path,
-            "endpoints": []
-        }
+    def _class_structure(self, target: type, eager: bool) -> dict:
+        """Return the API structure dict of a class, from the cache if available."""
+        structures = _structure_cache.get(target)
+        if structures is None:
+            structures = _structure_cache[target] = {}
 
-        # Add CRUD metadata if available
-        if hasattr(target, '_api_additem'):
-            structure["additem"] = target._api_additem
-        if hasattr(target, '_api_delitem'):
-            structure["delitem"] = target._api_delitem
+        # Children of eager structures are the module classes, which change
+        # when classes are defined, imported or get _api_base_path later
+        try:
+            classes = _module_apiready_classes(target.__module__) if eager else ()
+        except Exception:
+            classes = ()
+        cached = structures.get(eager)
+        if cached is not None and cached[0] == classes:
+            return cached[1]
+
+        structure = self._build_structure(target, eager, classes)
+        # Not cached while forward references are pending, see _sorted_endpoints()
+        if "_api_sorted_endpoints" in target.__dict__:
+            structures[eager] = (classes, structure)
+        return structure
+
+    def _instance_structure(self, instance: object, eager: bool) -> dict:
+        """Return the API structure dict of an instance.
+
+        The structure of the class is reused; in eager mode the @apiready
+        instance attributes (manager pattern) are listed first among the
+        children, followed by the module-level classes not already listed.
+        """
+        base = self._class_structure(instance.__class__, eager)
+        structure = dict(base)
+        if not eager:
+            return structure
 
-        # Add class docstring if available
-        if target.__doc__:
-            structure["docstring"] = inspect.cleandoc(target.__doc__)
+        # 1. Instance attributes (manager pattern): the declared subcomponents,
+        # or every public attribute
+        names = getattr(instance.__class__, '_api_subcomponents', None)
+        if names is not None:
+            attributes = ((name, getattr(instance, name, None)) for name in names)
+        else:
+            attributes = _public_attributes(instance)
 
-        # Iterate through class members to find decorated methods
-        for name, method in inspect.getmembers(target, inspect.isfunction):
-            # Check if method has API metadata
-            if not hasattr(method, '_api_metadata'):
+        children = []
+        seen_classes = set()
+        for name, attr in attributes:
+            try:
+                if hasattr(attr.__class__, '_api_base_path'):
+                    child_structure = self._instance_structure(attr, True)
+                    class_name = child_structure["class_name"]
+                    if class_name not in seen_classes:
+                        children.append(child_structure)
+                        seen_classes.add(class_name)
+            except Exception:
+                logger.debug("Skipping attribute %r of %r", name, instance, exc_info=True)
                 continue
 
-            metadata = method._api_metadata
+        # 2. Module-level @apiready classes, already collected for the class
+        children.extend(
+            child for child in base.get("children", ())
+            if child["class_name"] not in seen_classes
+        )
 
-            # Extract parameter information
-            parameters = self._extract_parameter_info(metadata["request_fields"])
+        if children:
+            structure["children"] = children
+        return structure
 
-            # Extract return type information
-            return_info = self._extract_type_info(metadata["return_type"])
+    def _format_structure(
+        self, structure: dict, mode: str, target: type
+    ) -> str | bytes | dict:
+        """Format an API structure dict according to mode.
 
-            # Build endpoint entry
-            endpoint = {
-                "path": metadata["endpoint_path"],
-                "method": metadata["http_method"],
-                "function_name": name,
-                "parameters": parameters,
-                "return_type": return_info,
-                "transaction": metadata.get("transaction", False)
-            }
+        Args:
+            structure: API structure dict
+            mode: Output format - "json", "yaml", "json-bytes", "yaml-bytes",
+                "markdown"/"md", "html" or "dict"
+            target: Class the structure was built for; the Markdown and HTML
+                formatters read its endpoints, with their rendered parameters
 
-            # Add docstring if available
-            if metadata.get("docstring"):
-                endpoint["docstring"] = inspect.cleandoc(metadata["docstring"])
+        Returns:
+            Formatted string or bytes, or a copy of the structure if mode is
+            not recognized
+        """
+        # Format output according to mode
+        if mode.lower() == "json":
+            return _dump_json(structure)
+        elif mode.lower() == "json-bytes":
+            return _dump_json_bytes(structure)
+        elif mode.lower() == "yaml":
+            return _dump_yaml(structure)
+        elif mode.lower() == "yaml-bytes":
+            return _dump_yaml(structure, encoding="utf-8")
+        elif mode.lower() in ("markdown", "md"):
+            return self._format_as_markdown(structure, _sorted_endpoints(target))
+        elif mode.lower() == "html":
+            return self._format_as_html(structure, _sorted_endpoints(target))
+        else:
+            # Return raw dict if mode not recognized, copied so that the
+            # caller can't alter the cached structures
+            return _copy_structure(structure)
+
+    @staticmethod
+    def clear_cache() -> None:
+        """Drop all cached API structures and formatted outputs."""
+        _structure_cache.clear()
+        _output_cache.clear()
+        for cls in list(_sorted_endpoint_classes):
+            if "_api_sorted_endpoints" in cls.__dict__:
+                del cls._api_sorted_endpoints
+            if "_api_structure_cached" in cls.__dict__:
+                del cls._api_structure_cached
+        _sorted_endpoint_classes.clear()
+        _module_apiready_cache.clear()
+
+    @staticmethod
+    def reload_module_cache(module_name: str | None = None) -> None:
+        """Forget the @apiready classes discovered in a module.
 
-            structure["endpoints"].append(endpoint)
+        Args:
+            module_name: Module to rescan on next eager introspection,
+                or None for all modules
+        """
+        if module_name is None:
+            _module_apiready_cache.clear()
+        else:
+            _module_apiready_cache.pop(module_name, None)
 
-        # Sort endpoints by path for consistent output
-        structure["endpoints"].sort(key=lambda x: x["path"])
+    def _build_structure(
+        self, target: type, eager: bool, module_classes: tuple[type, ...] = ()
+    ) -> dict:
+        """Build the API structure dict of an @apiready decorated class.
 
-        # If eager mode, look for @apiready attributes and classes
+        Args:
+            target: Class to introspect
+            eager: If True, collect the API structures of module-level classes as children
+            module_classes: @apiready classes of the module of target, see
+                _module_apiready_classes()
+
+        Returns:
+            API structure dict
+        """
+        # Children are added to a copy of the cached structure of the class
+        structure = dict(_base_structure(target))
+
+        # If eager mode, look for @apiready classes; instance attributes are
+        # added by _instance_structure()
         if eager:
             children = []
             seen_classes = set()
 
-            # 1. Instance attributes (manager pattern)
-            if instance is not None:
-                for name in dir(instance):
-                    if name.startswith('_'):
-                        continue
-                    try:
-                        attr = getattr(instance, name)
-                        if hasattr(attr, '__class__') and hasattr(attr.__class__, '_api_base_path'):
-                            child_structure = self.get_api_structure(attr, eager=True, mode="dict")
-                            class_name = child_structure["class_name"]
-                            if class_name not in seen_classes:
-                                children.append(child_structure)
-                                seen_classes.add(class_name)
-                    except:
-                        continue
-
-            # 2. Module-level @apiready classes (automatic discovery)
+            # Module-level @apiready classes (automatic discovery)
             try:
-                module = sys.modules.get(target.__module__)
-                if module:
-                    for name, obj in vars(module).items():
-                        if (inspect.isclass(obj) and
-                            hasattr(obj, '_api_base_path') and
-                            obj != target):
-                            class_name = obj.__name__
-                            if class_name not in seen_classes:
-                                child_structure = self.get_api_structure(obj, eager=False, mode="dict")
-                                children.append(child_structure)
-                                seen_classes.add(class_name)
+                for obj in module_classes:
+                    if obj != target:
+                        class_name = obj.__name__
+                        if class_name not in seen_classes:
+                            child_structure = self._class_structure(obj, False)
+                            children.append(child_structure)
+                            seen_classes.add(class_name)
             except:
                 pass
 
             if children:
                 structure["children"] = children
 
-        # Format output according to mode
-        if mode.lower() == "json":
-            return json.dumps(structure, indent=2, default=str)
-        elif mode.lower() == "yaml":
-            try:
-                import yaml
-                return yaml.dump(structure, default_flow_style=False, sort_keys=False)
-            except ImportError:
-                raise ImportError(
-                    "PyYAML is required for YAML output. "
-                    "Install it with: pip install pyyaml"
-                )
-        elif mode.lower() in ("markdown", "md"):
-            return self._format_as_markdown(structure)
-        elif mode.lower() == "html":
-            return self._format_as_html(structure)
-        else:
-            # Return raw dict if mode not recognized
-            return structure
+        return structure
 
     def get_api_structure_multi(
         self,
@@ -367,356 +1261,227 @@ class PublisherBridge:
         *,
         eager: bool = True,
         mode: str = "json"
-    ) -> str | list[dict]:
+    ) -> str | bytes | list[dict]:
         """Extract API structure from multiple @apiready decorated classes.
 
         Args:
             targets: List of classes or instances to introspect
             eager: If True, recursively collect all API metadata (default: True)
-            mode: Output format - "json" (default), "yaml", "markdown", or "html"
+            mode: Output format - "json" (default), "yaml", "markdown", or "html";
+                "json-bytes" and "yaml-bytes" return UTF-8 encoded JSON or YAML
 
         Returns:
-            Combined API structures as JSON string, YAML string, or list of dicts
+            Combined API structures as JSON string, YAML string, bytes, or list of dicts
 
         Example:
             structure = app.bridge.get_api_structure_multi([BookTable, ShelfTable])
         """
+        if mode.lower() in ("json", "json-bytes"):
+            return self._dump_json_multi(targets, eager, mode.lower())
+
         structures = []
 
         for target in targets:
-            structure = self.get_api_structure(target, eager=eager, mode="dict")
-            structures.append(structure)
+            structures.append(self._structure(target, eager))
 
         # Format output according to mode
-        if mode.lower() == "json":
-            return json.dumps(structures, indent=2, default=str)
-        elif mode.lower() == "yaml":
-            try:
-                import yaml
-                return yaml.dump(structures, default_flow_style=False, sort_keys=False)
-            except ImportError:
-                raise ImportError(
-                    "PyYAML is required for YAML output. "
-                    "Install it with: pip install pyyaml"
-                )
+        if mode.lower() == "yaml":
+            return _dump_yaml(structures)
+        elif mode.lower() == "yaml-bytes":
+            return _dump_yaml(structures, encoding="utf-8")
         elif mode.lower() in ("markdown", "md"):
-            return self._format_as_markdown_multi(structures)
+            return self._format_as_markdown_multi(self._with_endpoints(targets, structures))
         elif mode.lower() == "html":
-            return self._format_as_html_multi(structures)
+            return self._format_as_html_multi(self._with_endpoints(targets, structures))
         else:
             # Return raw list if mode not recognized
-            return structures
-
-    def _extract_parameter_info(self, request_fields: dict[str, tuple]) -> dict[str, dict]:
-        """Extract detailed parameter information from request fields."""
-        parameters = {}
-
-        for param_name, (param_type, default_value) in request_fields.items():
-            param_info = self._extract_type_info(param_type)
-            param_info["required"] = default_value is ...
-
-            if default_value is not ...:
-                param_info["default"] = default_value
-
-            parameters[param_name] = param_info
-
-        return parameters
-
-    def _extract_type_info(self, type_hint: Any) -> dict[str, Any]:
-        """Extract information from a type hint."""
-        info = {}
+            return _copy_structure(structures)
+
+    @staticmethod
+    def _with_endpoints(
+        targets: list[type | object], structures: list[dict]
+    ) -> list[tuple[dict, tuple[Endpoint, ...]]]:
+        """Pair the structures of targets with the endpoints of their classes."""
+        return [
+            (structure, _sorted_endpoints(target if inspect.isclass(target) else target.__class__))
+            for target, structure in zip(targets, structures)
+        ]
+
+    def _dump_json_multi(
+        self, targets: list[type | object], eager: bool, mode: str = "json"
+    ) -> str | bytes:
+        """Dump the API structures of targets as a JSON list, one target at a time.
+
+        The JSON of each target comes from get_api_structure() (cached for
+        classes) and is indented one level into the list, giving the same
+        document as dumping the list of structures with indent=2 without
+        holding all the structures at once. In "json-bytes" mode the document
+        is assembled from the encoded JSON of each target.
+        """
+        if mode == "json-bytes":
+            buf = io.BytesIO()
+            open_, newline, indent, comma, close = b"[", b"\n", b"\n  ", b",", b"]"
+        else:
+            buf = io.StringIO()
+            open_, newline, indent, comma, close = "[", "\n", "\n  ", ",", "]"
+        write = buf.write
 
-        # Handle None type
-        if type_hint is type(None):
-            info["type"] = "None"
-            return info
+        separator = indent
+        write(open_)
+        for target in targets:
+            write(separator)
+            separator = comma + indent
+            structure_json = self.get_api_structure(target, eager=eager, mode=mode)
+            write(structure_json.replace(newline, indent))
+        # An empty list is dumped as [] on one line
+        write(close if separator is indent else newline + close)
 
-        # Handle string forward references
-        if isinstance(type_hint, str):
-            info["type"] = type_hint
-            return info
+        return buf.getvalue()
 
-        # Check if it's an Annotated type with description
-        origin = get_origin(type_hint)
-
-        if origin is not None:
-            # Handle typing.Annotated
-            if hasattr(origin, '__name__') and origin.__name__ == 'Annotated':
-                args = get_args(type_hint)
-                if args:
-                    actual_type = args[0]
-                    info.update(self._extract_type_info(actual_type))
-
-                    if len(args) > 1:
-                        for metadata in args[1:]:
-                            if isinstance(metadata, str):
-                                info["description"] = metadata
-                                break
-                    return info
-
-            # Handle Union types
-            if origin is type(None) or (hasattr(origin, '__name__') and 'Union' in origin.__name__):
-                args = get_args(type_hint)
-                if args:
-                    type_names = []
-                    for arg in args:
-                        if arg is type(None):
-                            type_names.append("None")
-                        elif hasattr(arg, '__name__'):
-                            type_names.append(arg.__name__)
-                        else:
-                            type_names.append(str(arg))
-                    info["type"] = " | ".join(type_names)
-                    return info
-
-            # Handle generic types (list, dict, etc.)
-            if hasattr(origin, '__name__'):
-                args = get_args(type_hint)
-                if args:
-                    arg_names = []
-                    for arg in args:
-                        if hasattr(arg, '__name__'):
-                            arg_names.append(arg.__name__)
-                        else:
-                            arg_names.append(str(arg))
-                    info["type"] = f"{origin.__name__}[{', '.join(arg_names)}]"
-                else:
-                    info["type"] = origin.__name__
-                return info
-
-        # Handle simple types with __name__
-        if hasattr(type_hint, '__name__'):
-            info["type"] = type_hint.__name__
-            return info
-
-        # Fallback: convert to string
-        info["type"] = str(type_hint)
-        return info
-
-    def _format_as_markdown(self, structure: dict) -> str:
+    def _format_as_markdown(self, structure: dict, endpoints: tuple[Endpoint, ...]) -> str:
         """Format API structure as compact Markdown list."""
-        lines = []
-
-        lines.append(f"### {structure['class_name']} [{structure['base_path']}]")
-        lines.append("")
-
-        for endpoint in structure["endpoints"]:
-            method = endpoint['method']
-            path = endpoint['path']
-            func = endpoint['function_name']
-            return_type = endpoint.get("return_type", {})
+        buf = io.StringIO()
+        write = buf.write
+        class_name = structure['class_name']
+        base_path = structure['base_path']
+
+        write(f"### {class_name} [{base_path}]\n\n")
+
+        for endpoint in endpoints:
+            method = endpoint.method
+            path = endpoint.path
+            func = endpoint.function_name
+            return_type = endpoint.return_type or _EMPTY_DICT
             return_type_str = return_type.get("type", "None")
 
-            full_path = structure['base_path'] + path
+            full_path = base_path + path
 
-            params = endpoint.get("parameters", {})
+            params = endpoint.parameters
             param_line = ""
             if params:
-                param_list = []
-                for param_name, param_info in params.items():
-                    param_type = param_info.get("type", "Any")
-                    required = param_info.get("required", False)
-                    default = param_info.get("default", "")
-
-                    if required:
-                        param_list.append(f"{param_name} {param_type}")
-                    else:
-                        if default == "":
-                            default_str = ""
-                        elif default is None:
-                            default_str = "None"
-                        else:
-                            default_str = str(default)
-                        param_list.append(f"{param_name} {param_type}={default_str}")
-
-                param_line = f"<br>&nbsp;&nbsp;Parameters: {', '.join(param_list)}"
-
-            lines.append(
+                param_line = f"<br>&nbsp;&nbsp;Parameters: {endpoint.rendered_parameters}"
+
+            write(
                 f"**{func}**<br>"
                 f"&nbsp;&nbsp;{method} {full_path} -> {return_type_str}"
-                f"{param_line}"
+                f"{param_line}\n\n"
             )
-            lines.append("")
 
-        return "\n".join(lines)
+        # Every block ends with a blank line, the last newline is not part of the output
+        return buf.getvalue()[:-1]
 
-    def _format_as_html(self, structure: dict) -> str:
+    def _format_as_html(self, structure: dict, endpoints: tuple[Endpoint, ...]) -> str:
         """Format API structure as HTML."""
-        lines = []
-
-        lines.append("<!DOCTYPE html>")
-        lines.append("<html>")
-        lines.append("<head>")
-        lines.append(f"<title>{structure['class_name']} API</title>")
-        lines.append("<style>")
-        lines.append("body { font-family: monospace; margin: 20px; }")
-        lines.append("h3 { color: #333; font-size: 1.5em; font-weight: bold; margin-top: 20px; border-bottom: 2px solid #333; padding-bottom: 5px; }")
-        lines.append(".endpoint { margin-bottom: 20px; }")
-        lines.append(".name { font-weight: bold; }")
-        lines.append(".command { margin-left: 20px; line-height: 1.2; }")
-        lines.append(".params { margin-left: 20px; line-height: 1.2; }")
-        lines.append("</style>")
-        lines.append("</head>")
-        lines.append("<body>")
-
-        lines.append(f"<h3>{structure['class_name']} [{structure['base_path']}]</h3>")
-
-        for endpoint in structure["endpoints"]:
-            method = endpoint['method']
-            path = endpoint['path']
-            func = endpoint['function_name']
-            return_type = endpoint.get("return_type", {})
+        buf = io.StringIO()
+        write = buf.write
+        class_name = structure['class_name']
+        base_path = structure['base_path']
+
+        write(_HTML_HEAD.format(title=f"{class_name} API"))
+        write(f"<h3>{class_name} [{base_path}]</h3>\n")
+
+        for endpoint in endpoints:
+            method = endpoint.method
+            path = endpoint.path
+            func = endpoint.function_name
+            return_type = endpoint.return_type or _EMPTY_DICT
             return_type_str = return_type.get("type", "None")
 
-            full_path = structure['base_path'] + path
-
-            lines.append('<div class="endpoint">')
-            lines.append(f'  <div class="name">{func}</div>')
-            lines.append(f'  <div class="command">{method} {full_path} -&gt; {return_type_str}</div>')
+            full_path = base_path + path
 
-            params = endpoint.get("parameters", {})
+            params = endpoint.parameters
+            param_div = ""
             if params:
-                param_list = []
-                for param_name, param_info in params.items():
-                    param_type = param_info.get("type", "Any")
-                    required = param_info.get("required", False)
-                    default = param_info.get("default", "")
-
-                    if required:
-                        param_list.append(f"{param_name} {param_type}")
-                    else:
-                        if default == "":
-                            default_str = ""
-                        elif default is None:
-                            default_str = "None"
-                        else:
-                            default_str = str(default)
-                        param_list.append(f"{param_name} {param_type}={default_str}")
-
-                lines.append(f'  <div class="params">Parameters: {", ".join(param_list)}</div>')
-
-            lines.append('</div>')
+                rendered = endpoint.rendered_parameters
+                param_div = f'  <div class="params">Parameters: {rendered}</div>\n'
+
+            write(
+                '<div class="endpoint">\n'
+                f'  <div class="name">{func}</div>\n'
+                f'  <div class="command">{method} {full_path} -&gt; {return_type_str}</div>\n'
+                f'{param_div}</div>\n'
+            )
 
-        lines.append("</body>")
-        lines.append("</html>")
+        write(_HTML_FOOT)
 
-        return "\n".join(lines)
+        return buf.getvalue()
 
-    def _format_as_markdown_multi(self, structures: list[dict]) -> str:
+    def _format_as_markdown_multi(
+        self, structures: list[tuple[dict, tuple[Endpoint, ...]]]
+    ) -> str:
         """Format multiple API structures as combined Markdown document."""
-        lines = []
+        buf = io.StringIO()
+        write = buf.write
 
-        lines.append("## API Documentation")
-        lines.append("")
+        write("## API Documentation\n\n")
 
-        for structure in structures:
-            lines.append(f"### {structure['class_name']} [{structure['base_path']}]")
-            lines.append("")
+        for structure, endpoints in structures:
+            class_name = structure['class_name']
+            base_path = structure['base_path']
+            write(f"### {class_name} [{base_path}]\n\n")
 
-            for endpoint in structure["endpoints"]:
-                method = endpoint['method']
-                path = endpoint['path']
-                func = endpoint['function_name']
-                return_type = endpoint.get("return_type", {})
+            for endpoint in endpoints:
+                method = endpoint.method
+                path = endpoint.path
+                func = endpoint.function_name
+                return_type = endpoint.return_type or _EMPTY_DICT
                 return_type_str = return_type.get("type", "None")
 
-                params = endpoint.get("parameters", {})
+                params = endpoint.parameters
                 param_line = ""
                 if params:
-                    param_list = []
-                    for param_name, param_info in params.items():
-                        param_type = param_info.get("type", "Any")
-                        required = param_info.get("required", False)
-                        default = param_info.get("default", "")
-
-                        if required:
-                            param_list.append(f"{param_name} {param_type}")
-                        else:
-                            if default == "":
-                                default_str = ""
-                            elif default is None:
-                                default_str = "None"
-                            else:
-                                default_str = str(default)
-                            param_list.append(f"{param_name} {param_type}={default_str}")
-
-                    param_line = f"<br>&nbsp;&nbsp;Parameters: {', '.join(param_list)}"
-
-                lines.append(
+                    param_line = f"<br>&nbsp;&nbsp;Parameters: {endpoint.rendered_parameters}"
+
+                write(
                     f"**{func}**<br>"
                     f"&nbsp;&nbsp;{method} {path} -> {return_type_str}"
-                    f"{param_line}"
+                    f"{param_line}\n\n"
                 )
-                lines.append("")
 
-            lines.append("")
+            write("\n")
 
-        return "\n".join(lines)
+        # Every block ends with a blank line, the last newline is not part of the output
+        return buf.getvalue()[:-1]
 
-    def _format_as_html_multi(self, structures: list[dict]) -> str:
+    def _format_as_html_multi(
+        self, structures: list[tuple[dict, tuple[Endpoint, ...]]]
+    ) -> str:
         """Format multiple API structures as combined HTML document."""
-        lines = []
-
-        lines.append("<!DOCTYPE html>")
-        lines.append("<html>")
-        lines.append("<head>")
-        lines.append("<title>API Documentation</title>")
-        lines.append("<style>")
-        lines.append("body { font-family: monospace; margin: 20px; }")
-        lines.append("h2 { color: #333; border-bottom: 2px solid #333; padding-bottom: 5px; }")
-        lines.append("h3 { color: #555; }")
-        lines.append(".class-section { margin-bottom: 40px; }")
-        lines.append(".endpoint { margin-bottom: 20px; }")
-        lines.append(".name { font-weight: bold; }")
-        lines.append(".command { margin-left: 20px; line-height: 1.2; }")
-        lines.append(".params { margin-left: 20px; line-height: 1.2; }")
-        lines.append("</style>")
-        lines.append("</head>")
-        lines.append("<body>")
-
-        lines.append("<h2>API Documentation</h2>")
-
-        for structure in structures:
-            lines.append('<div class="class-section">')
-            lines.append(f"<h3>{structure['class_name']} [{structure['base_path']}]</h3>")
-
-            for endpoint in structure["endpoints"]:
-                method = endpoint['method']
-                path = endpoint['path']
-                func = endpoint['function_name']
-                return_type = endpoint.get("return_type", {})
-                return_type_str = return_type.get("type", "None")
-
-                lines.append('<div class="endpoint">')
-                lines.append(f'  <div class="name">{func}</div>')
-                lines.append(f'  <div class="command">{method} {path} -&gt; {return_type_str}</div>')
+        buf = io.StringIO()
+        write = buf.write
 
-                params = endpoint.get("parameters", {})
-                if params:
-                    param_list = []
-                    for param_name, param_info in params.items():
-                        param_type = param_info.get("type", "Any")
-                        required = param_info.get("required", False)
-                        default = param_info.get("default", "")
+        write(_HTML_MULTI_HEAD)
 
-                        if required:
-                            param_list.append(f"{param_name} {param_type}")
-                        else:
-                            if default == "":
-                                default_str = ""
-                            elif default is None:
-                                default_str = "None"
-                            else:
-                                default_str = str(default)
-                            param_list.append(f"{param_name} {param_type}={default_str}")
+        for structure, endpoints in structures:
+            class_name = structure['class_name']
+            base_path = structure['base_path']
+            write(
+                '<div class="class-section">\n'
+                f"<h3>{class_name} [{base_path}]</h3>\n"
+            )
 
-                    lines.append(f'  <div class="params">Parameters: {", ".join(param_list)}</div>')
+            for endpoint in endpoints:
+                method = endpoint.method
+                path = endpoint.path
+                func = endpoint.function_name
+                return_type = endpoint.return_type or _EMPTY_DICT
+                return_type_str = return_type.get("type", "None")
 
-                lines.append('</div>')
+                params = endpoint.parameters
+                param_div = ""
+                if params:
+                    rendered = endpoint.rendered_parameters
+                    param_div = f'  <div class="params">Parameters: {rendered}</div>\n'
+
+                write(
+                    '<div class="endpoint">\n'
+                    f'  <div class="name">{func}</div>\n'
+                    f'  <div class="command">{method} {path} -&gt; {return_type_str}</div>\n'
+                    f'{param_div}</div>\n'
+                )
 
-            lines.append('</div>')
+            write('</div>\n')
 
-        lines.append("</body>")
-        lines.append("</html>")
+        write(_HTML_FOOT)
 
-        return "\n".join(lines)
+        return buf.getvalue()
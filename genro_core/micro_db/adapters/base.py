@@ -16,13 +16,25 @@
 """Base database adapter interface."""
 
 from abc import ABC, abstractmethod
-from typing import Any, TYPE_CHECKING
+from contextlib import contextmanager
+from decimal import Decimal
+from itertools import groupby
+from typing import Any, Iterable, TYPE_CHECKING
+
+from ..column import _apply_size, _parse_size
 
 if TYPE_CHECKING:
     from ..table import Table
     from ..compiler import GenroMicroCompiler
 
 
+# Genropy dtype whose size format applies, by Python type; other types don't use size
+_SIZED_DTYPES: dict[type, str] = {
+    str: 'C',
+    Decimal: 'N',
+}
+
+
 class DatabaseAdapter(ABC):
     """
     Base class for database adapters.
@@ -32,12 +44,30 @@ class DatabaseAdapter(ABC):
     migration logic.
     """
 
+    # Maximum number of bound parameters in one statement
+    max_params: int = 999
+
+    def __init__(self):
+        # Compilers by table SQL name, and compiled INSERT/UPDATE/DELETE
+        # statements by (kind, table SQL name, field names...)
+        self._compilers: dict[str, "GenroMicroCompiler"] = {}
+        self._stmt_cache: dict[tuple, Any] = {}
+        # Depth of nested transaction() blocks; writes don't commit inside them
+        self._txn_depth = 0
+        # Table state read by prefetched_schemas(): sql_name -> (exists, schema)
+        self._prefetched: dict[str, tuple[bool, dict | None]] = {}
+        # Constant per adapter, read by every CREATE TABLE
+        self._autoincrement = self.get_autoincrement_syntax()
+
     @property
     @abstractmethod
     def type_map(self) -> dict[type, str]:
         """
         Map Python types to SQL types for this database.
 
+        The mapping never changes: adapters override this with a class
+        attribute holding a read-only mapping, built once at import.
+
         Returns:
             Dictionary mapping Python type to SQL type string
 
@@ -93,31 +123,10 @@ class DatabaseAdapter(ABC):
         Returns:
             SQL type with size applied
         """
-        from decimal import Decimal
-
-        # String types
-        if py_type == str:
-            if isinstance(size, int):
-                # Fixed length: CHAR(5)
-                return f'CHAR({size})'
-            elif isinstance(size, str) and ':' in size:
-                # Variable length with range: '1:10' → VARCHAR(10)
-                _, max_len = size.split(':')
-                return f'VARCHAR({max_len})'
-            else:
-                # Just a number as string
-                return f'CHAR({size})'
-
-        # Decimal types
-        elif py_type == Decimal:
-            if isinstance(size, str) and ',' in size:
-                # Precision and scale: '10,2' → NUMERIC(10,2)
-                return f'NUMERIC({size})'
-            else:
-                return base_type
-
-        # Other types don't use size
-        return base_type
+        dtype = _SIZED_DTYPES.get(py_type)
+        if dtype is None:
+            return base_type
+        return _apply_size(dtype, *_parse_size(size), base_type)
 
     @abstractmethod
     def get_current_schema(self, cursor: Any, table_name: str) -> dict:
@@ -133,6 +142,23 @@ class DatabaseAdapter(ABC):
         """
         pass
 
+    def get_current_schemas(self, cursor: Any, table_names: Iterable[str]) -> dict[str, dict]:
+        """
+        Get current schemas of several tables from database.
+
+        Runs get_current_schema() for each table; adapters override this
+        to fetch all tables with one query.
+
+        Args:
+            cursor: Database cursor
+            table_names: Names of tables
+
+        Returns:
+            Dictionary mapping table name to its schema, as returned by
+            get_current_schema()
+        """
+        return {name: self.get_current_schema(cursor, name) for name in table_names}
+
     @abstractmethod
     def supports_drop_column(self) -> bool:
         """Check if database supports DROP COLUMN."""
@@ -143,18 +169,100 @@ class DatabaseAdapter(ABC):
         """Get AUTOINCREMENT syntax for this database."""
         pass
 
+    @contextmanager
+    def transaction(self, table: "Table"):
+        """
+        Context manager grouping writes into one transaction.
+
+        Inside the block insert, insert_many, update, update_many, delete and migrate
+        don't commit: changes are committed once on exit, or rolled back if
+        the block raises. Blocks can be nested; only the outermost one
+        commits or rolls back.
+
+        Args:
+            table: Table instance, whose database connection is used
+
+        Usage:
+            with db.adapter.transaction(db.tables.book):
+                for record in records:
+                    db.tables.book.insert(record=record)
+        """
+        connection = table.db.connection
+        self._txn_depth += 1
+        try:
+            yield
+        except BaseException:
+            if self._txn_depth == 1:
+                connection.rollback()
+            raise
+        else:
+            if self._txn_depth == 1:
+                connection.commit()
+        finally:
+            self._txn_depth -= 1
+
+    def _commit(self, db: Any) -> None:
+        """Commit after a write, unless inside a transaction() block."""
+        if not self._txn_depth:
+            db.connection.commit()
+
     def get_compiler(self, table: "Table") -> "GenroMicroCompiler":
         """
         Get a compiler instance for the table.
 
+        Compilers hold no per-query state, so one is created per table
+        SQL name and reused.
+
         Args:
             table: Table instance
 
         Returns:
             GenroMicroCompiler instance
         """
-        from ..compiler import GenroMicroCompiler
-        return GenroMicroCompiler(table.sql_name)
+        compiler = self._compilers.get(table.sql_name)
+        if compiler is None:
+            from ..compiler import GenroMicroCompiler
+            compiler = self._compilers[table.sql_name] = GenroMicroCompiler(table.sql_name)
+        return compiler
+
+    def _insert_sql(self, table: "Table", field_names: tuple[str, ...]) -> str:
+        """Return the INSERT statement for field_names, compiled once per table."""
+        key = ('I', table.sql_name, field_names)
+        sql = self._stmt_cache.get(key)
+        if sql is None:
+            compiler = self.get_compiler(table)
+            sql, _ = compiler.compile_insert(table, dict.fromkeys(field_names))
+            self._stmt_cache[key] = sql
+        return sql
+
+    def _update_sql(
+        self, table: "Table", field_names: tuple[str, ...], pk_field: str
+    ) -> tuple[str | None, tuple[str, ...]]:
+        """
+        Return the UPDATE statement for field_names, compiled once per table.
+
+        Returns:
+            Tuple of (sql_string or None if there is nothing to update,
+            names of the fields in SET order)
+        """
+        key = ('U', table.sql_name, field_names, pk_field)
+        entry = self._stmt_cache.get(key)
+        if entry is None:
+            compiler = self.get_compiler(table)
+            sql, _ = compiler.compile_update(table, dict.fromkeys(field_names), pk_field, None)
+            set_fields = tuple(name for name in field_names if name != pk_field)
+            entry = self._stmt_cache[key] = (sql, set_fields)
+        return entry
+
+    def _delete_sql(self, table: "Table", pk_field: str) -> str:
+        """Return the DELETE statement by primary key, compiled once per table."""
+        key = ('D', table.sql_name, pk_field)
+        sql = self._stmt_cache.get(key)
+        if sql is None:
+            compiler = self.get_compiler(table)
+            sql, _ = compiler.compile_delete(table, pk_field, None)
+            self._stmt_cache[key] = sql
+        return sql
 
     def insert(self, table: "Table", data: dict) -> Any:
         """
@@ -170,12 +278,11 @@ class DatabaseAdapter(ABC):
         This method delegates SQL generation to the compiler,
         then executes and returns the primary key of the newly created record.
         """
-        # Get compiler and generate SQL
-        compiler = self.get_compiler(table)
-        sql, values = compiler.compile_insert(table, data)
+        # SQL is compiled once per table and field names
+        sql = self._insert_sql(table, tuple(data))
 
         with table.cursor() as cursor:
-            cursor.execute(sql, values)
+            cursor.execute(sql, tuple(data.values()))
 
             # Get the inserted record's primary key
             # Use provided pk value if pk_field was in data, otherwise use lastrowid
@@ -184,9 +291,55 @@ class DatabaseAdapter(ABC):
             else:
                 pk_value = cursor.lastrowid
 
-        table.db.connection.commit()
+        self._commit(table.db)
         return pk_value
 
+    def insert_many(self, table: "Table", records: list[dict]) -> int:
+        """
+        Insert several records into the table in a single transaction.
+
+        Args:
+            table: Table instance
+            records: List of dictionaries of field values
+
+        Returns:
+            Number of inserted records
+
+        Consecutive records with the same fields share one compiled INSERT,
+        executed with cursor.executemany(). Records without the primary key
+        (database auto-increment) are inserted one at a time instead, since
+        executemany() reports no lastrowid, and get the generated key set
+        in the record as insert() returns it. Changes are committed once at
+        the end, or rolled back if any record fails.
+        """
+        pk_field = table.pkey
+        count = 0
+
+        try:
+            with table.cursor() as cursor:
+                for _, group in groupby(records, key=frozenset):
+                    batch = list(group)
+                    field_names = tuple(batch[0])
+                    sql = self._insert_sql(table, field_names)
+                    if pk_field in field_names:
+                        cursor.executemany(
+                            sql, [tuple(record[name] for name in field_names) for record in batch]
+                        )
+                    else:
+                        for record in batch:
+                            cursor.execute(sql, tuple(record[name] for name in field_names))
+                            record[pk_field] = cursor.lastrowid
+                    count += len(batch)
+        except Exception:
+            # Inside transaction() the whole block is rolled back on exit
+            if not self._txn_depth:
+                table.db.connection.rollback()
+            raise
+
+        if count:
+            self._commit(table.db)
+        return count
+
     def update(self, table: "Table", record: dict, oldRecord: dict = None) -> dict:
         """
         Update a record in the table.
@@ -209,19 +362,68 @@ class DatabaseAdapter(ABC):
 
         pk_value = record[pk_field]
 
-        # Get compiler and generate SQL
-        compiler = self.get_compiler(table)
-        sql, values = compiler.compile_update(table, record, pk_field, pk_value)
+        # SQL is compiled once per table and field names
+        sql, set_fields = self._update_sql(table, tuple(record), pk_field)
 
         if sql is None:
             return record  # Nothing to update
 
+        values = tuple(record[name] for name in set_fields) + (pk_value,)
         with table.cursor() as cursor:
             cursor.execute(sql, values)
 
-        table.db.connection.commit()
+        self._commit(table.db)
         return record
 
+    def update_many(self, table: "Table", records: list[dict]) -> int:
+        """
+        Update several records in the table in a single transaction.
+
+        Args:
+            table: Table instance
+            records: List of record dictionaries, each with the primary key
+
+        Returns:
+            Number of updated rows
+
+        Consecutive records with the same fields are written by one UPDATE
+        per batch, setting each field with a CASE on the primary key; batches
+        respect max_params. When a primary key repeats in a batch, its last
+        record wins, as with one update() per record.
+        """
+        pk_field = table.pkey
+        for record in records:
+            if pk_field not in record:
+                raise ValueError(f"Primary key '{pk_field}' not found in record")
+
+        compiler = self.get_compiler(table)
+        count = 0
+
+        try:
+            with table.cursor() as cursor:
+                for _, group in groupby(records, key=frozenset):
+                    batch = list({record[pk_field]: record for record in group}.values())
+                    set_fields = [name for name in batch[0] if name != pk_field]
+                    if not set_fields:
+                        continue  # Nothing to update
+
+                    size = max(1, self.max_params // (2 * len(set_fields) + 1))
+                    for start in range(0, len(batch), size):
+                        sql, values = compiler.compile_update_many(
+                            table, set_fields, pk_field, batch[start:start + size]
+                        )
+                        cursor.execute(sql, values)
+                        count += cursor.rowcount
+        except Exception:
+            # Inside transaction() the whole block is rolled back on exit
+            if not self._txn_depth:
+                table.db.connection.rollback()
+            raise
+
+        if count:
+            self._commit(table.db)
+        return count
+
     def delete(self, table: "Table", record: dict) -> None:
         """
         Delete a record from the table.
@@ -240,14 +442,13 @@ class DatabaseAdapter(ABC):
 
         pk_value = record[pk_field]
 
-        # Get compiler and generate SQL
-        compiler = self.get_compiler(table)
-        sql, values = compiler.compile_delete(table, pk_field, pk_value)
+        # SQL is compiled once per table and primary key field
+        sql = self._delete_sql(table, pk_field)
 
         with table.cursor() as cursor:
-            cursor.execute(sql, values)
+            cursor.execute(sql, (pk_value,))
 
-        table.db.connection.commit()
+        self._commit(table.db)
 
     def migrate(self, table: "Table", drop_columns: bool = False) -> list[str]:
         """
@@ -264,37 +465,117 @@ class DatabaseAdapter(ABC):
         1. Checks if table exists
         2. If not exists: CREATE TABLE
         3. If exists: compare and ALTER TABLE as needed
+
+        Inside prefetched_schemas(), steps 1 and 3 use the state read for
+        all tables at once.
         """
-        migrations = []
+        # Prefetched state is used once: later calls see this migration
+        exists, current_schema = self._prefetched.pop(table.sql_name, (None, None))
 
         with table.cursor() as cursor:
-            # Check if table exists
-            if not self._table_exists(cursor, table.sql_name):
-                # CREATE TABLE
-                sql = self._generate_create_table_sql(table)
-                cursor.execute(sql)
-                migrations.append(sql)
-            else:
-                # ALTER TABLE
-                current_schema = self.get_current_schema(cursor, table.sql_name)
-                desired_schema = self._get_desired_schema(table)
-
-                # Add missing columns
-                for col_name, col_info in desired_schema.items():
-                    if col_name not in current_schema:
-                        sql = self._generate_add_column_sql(table.sql_name, col_name, col_info)
-                        cursor.execute(sql)
-                        migrations.append(sql)
-
-                # Remove extra columns (if requested)
-                if drop_columns:
-                    columns_to_drop = set(current_schema.keys()) - set(desired_schema.keys())
-                    if columns_to_drop:
-                        drop_migrations = self._drop_columns(cursor, table, columns_to_drop)
-                        migrations.extend(drop_migrations)
+            migrations = self._migrate_table(
+                cursor, table, drop_columns, exists=exists, current_schema=current_schema
+            )
 
         if migrations:
-            table.db.connection.commit()
+            self._commit(table.db)
+
+        return migrations
+
+    @contextmanager
+    def prefetched_schemas(self, tables: list["Table"]):
+        """
+        Context manager reading the state of several tables at once for migrate().
+
+        Table existence and current schemas are fetched for all tables with
+        one batch (see _tables_exist() and get_current_schemas()). Inside the
+        block, the first migrate() of each of these tables uses its
+        prefetched state instead of querying it, and changes are committed
+        once on exit (see transaction()).
+
+        Args:
+            tables: Table instances of the same database
+
+        Usage:
+            with db.adapter.prefetched_schemas(tables):
+                for table in tables:
+                    table.migrate()
+        """
+        if not tables:
+            yield
+            return
+
+        with tables[0].db.cursor() as cursor:
+            existing = self._tables_exist(cursor, [table.sql_name for table in tables])
+            schemas = self.get_current_schemas(cursor, existing)
+
+        self._prefetched = {
+            table.sql_name: (table.sql_name in existing, schemas.get(table.sql_name))
+            for table in tables
+        }
+        try:
+            with self.transaction(tables[0]):
+                yield
+        finally:
+            self._prefetched = {}
+
+    def _migrate_table(
+        self,
+        cursor: Any,
+        table: "Table",
+        drop_columns: bool,
+        exists: bool | None = None,
+        current_schema: dict | None = None,
+    ) -> list[str]:
+        """
+        Execute the statements migrating one table, without committing.
+
+        Args:
+            cursor: Database cursor
+            table: Table instance with column definitions
+            drop_columns: If True, remove columns not in schema (DESTRUCTIVE!)
+            exists: Whether the table exists, queried if None
+            current_schema: Current table schema, queried if None
+
+        Returns:
+            List of SQL statements executed
+        """
+        migrations = []
+
+        # Check if table exists
+        if exists is None:
+            exists = self._table_exists(cursor, table.sql_name)
+
+        if not exists:
+            # CREATE TABLE
+            sql = self._generate_create_table_sql(table)
+            cursor.execute(sql)
+            migrations.append(sql)
+        else:
+            # ALTER TABLE
+            if current_schema is None:
+                current_schema = self.get_current_schema(cursor, table.sql_name)
+            desired_schema = self._get_desired_schema(table)
+
+            # Same columns on both sides: nothing to add or drop
+            if current_schema.keys() == desired_schema.keys():
+                return migrations
+
+            # Add missing columns
+            clauses = [
+                self._format_add_column_clause(col_name, col_info)
+                for col_name, col_info in desired_schema.items()
+                if col_name not in current_schema
+            ]
+            if clauses:
+                migrations.extend(self._execute_add_columns(cursor, table.sql_name, clauses))
+
+            # Remove extra columns (if requested)
+            if drop_columns:
+                columns_to_drop = current_schema.keys() - desired_schema.keys()
+                if columns_to_drop:
+                    drop_migrations = self._drop_columns(cursor, table, columns_to_drop)
+                    migrations.extend(drop_migrations)
 
         return migrations
 
@@ -303,14 +584,34 @@ class DatabaseAdapter(ABC):
         """Check if table exists in database."""
         pass
 
+    def _tables_exist(self, cursor: Any, table_names: Iterable[str]) -> set[str]:
+        """
+        Check which of several tables exist in database.
+
+        Runs _table_exists() for each table; adapters override this to
+        check all tables with one query.
+
+        Returns:
+            Set of the names of existing tables
+        """
+        return {name for name in table_names if self._table_exists(cursor, name)}
+
     def _get_desired_schema(self, table: "Table") -> dict:
         """
         Get desired schema from table columns definition.
 
+        The schema is cached on the table until its columns change (see
+        Table.add_column()) and must be treated as read-only.
+
         Returns:
             Dictionary mapping column name to column info dict
         """
+        cached = table._desired_schema_cache
+        if cached is not None and cached[0] == table._cols_version and cached[1] is table.columns:
+            return cached[2]
+
         schema = {}
+        pkey = table.pkey
         for col_name, column in table.columns.items():
             schema[col_name] = {
                 'name': col_name,
@@ -319,9 +620,11 @@ class DatabaseAdapter(ABC):
                 'sql_type': column.sql_type,        # Uses lazy cached property with size
                 'size': column.size,
                 'not_null': column.not_null,
-                'primary_key': col_name == table.pkey,
+                'primary_key': col_name == pkey,
                 'default': column.default,
             }
+
+        table._desired_schema_cache = (table._cols_version, table.columns, schema)
         return schema
 
     def _generate_create_table_sql(self, table: "Table") -> str:
@@ -333,8 +636,17 @@ class DatabaseAdapter(ABC):
 
         Returns:
             SQL CREATE TABLE statement
+
+        Like the desired schema, the statement is cached on the table until
+        its columns change.
         """
+        cached = table._create_sql_cache
+        if cached is not None and cached[0] == table._cols_version and cached[1] is table.columns:
+            return cached[2]
+
         columns = []
+        pkey = table.pkey
+        autoincrement = self._autoincrement
 
         for col_name, column in table.columns.items():
             # Use Column.sql_type which already has size applied
@@ -344,40 +656,59 @@ class DatabaseAdapter(ABC):
             col_sql_name = column.sql_name
 
             parts = [col_sql_name, sql_type]
+            is_pk = col_name == pkey
 
             # Primary key
-            if col_name == table.pkey:
+            if is_pk:
                 parts.append('PRIMARY KEY')
                 if sql_type.startswith('INTEGER'):
-                    parts.append(self.get_autoincrement_syntax())
+                    parts.append(autoincrement)
 
             # NOT NULL constraint
-            if column.not_null and col_name != table.pkey:
+            elif column.not_null:
                 parts.append('NOT NULL')
 
             # DEFAULT value
             if column.default is not None:
-                default_val = column.default
-                if isinstance(default_val, str):
-                    parts.append(f"DEFAULT '{default_val}'")
-                else:
-                    parts.append(f"DEFAULT {default_val}")
+                parts.append(f"DEFAULT {self._format_default(column.default)}")
 
             columns.append(' '.join(parts))
 
-        return f"CREATE TABLE IF NOT EXISTS {table.sql_name} ({', '.join(columns)})"
+        sql = f"CREATE TABLE IF NOT EXISTS {table.sql_name} ({', '.join(columns)})"
+        table._create_sql_cache = (table._cols_version, table.columns, sql)
+        return sql
 
-    def _generate_add_column_sql(self, table_name: str, col_name: str, col_info: dict) -> str:
+    def _format_default(self, value: Any) -> str:
         """
-        Generate ALTER TABLE ADD COLUMN SQL statement.
+        Format a column default as an SQL literal.
+
+        DDL statements take no bound parameters, so defaults are written
+        inline: strings (and other non-numeric values) are quoted with
+        embedded quotes doubled.
+
+        Args:
+            value: Default value
+
+        Returns:
+            SQL literal
+        """
+        if isinstance(value, bool):
+            return 'TRUE' if value else 'FALSE'
+        if isinstance(value, (int, float, Decimal)):
+            return str(value)
+        escaped = str(value).replace("'", "''")
+        return f"'{escaped}'"
+
+    def _format_add_column_clause(self, col_name: str, col_info: dict) -> str:
+        """
+        Generate the ADD COLUMN clause of an ALTER TABLE statement.
 
         Args:
-            table_name: Name of table
             col_name: Column name
             col_info: Column information dict from _get_desired_schema()
 
         Returns:
-            SQL ALTER TABLE ADD COLUMN statement
+            SQL ADD COLUMN clause
         """
         # col_info now has 'sql_type' already computed by Column.sql_type
         sql_type = col_info['sql_type']
@@ -388,13 +719,31 @@ class DatabaseAdapter(ABC):
         # Note: Can't add NOT NULL without default on existing tables
         # in most databases, so we skip it here
         if col_info.get('default') is not None:
-            default_val = col_info['default']
-            if isinstance(default_val, str):
-                parts.append(f"DEFAULT '{default_val}'")
-            else:
-                parts.append(f"DEFAULT {default_val}")
+            parts.append(f"DEFAULT {self._format_default(col_info['default'])}")
+
+        return f"ADD COLUMN {' '.join(parts)}"
+
+    def _execute_add_columns(self, cursor: Any, table_name: str, clauses: list[str]) -> list[str]:
+        """
+        Add columns to an existing table.
+
+        One ALTER TABLE statement is executed per column, as every engine
+        accepts; adapters override this to combine them when possible.
+
+        Args:
+            cursor: Database cursor
+            table_name: Name of table
+            clauses: ADD COLUMN clauses from _format_add_column_clause()
 
-        return f"ALTER TABLE {table_name} ADD COLUMN {' '.join(parts)}"
+        Returns:
+            List of SQL statements executed
+        """
+        migrations = []
+        for clause in clauses:
+            sql = f"ALTER TABLE {table_name} {clause}"
+            cursor.execute(sql)
+            migrations.append(sql)
+        return migrations
 
     @abstractmethod
     def _drop_columns(self, cursor: Any, table: "Table", columns: set[str]) -> list[str]:
@@ -17,28 +17,33 @@
 
 from datetime import date, datetime, time
 from decimal import Decimal
-from typing import Any
+from types import MappingProxyType
+from typing import Any, Iterable
 
 from .base import DatabaseAdapter
 
+# Python types to PostgreSQL types, shared by all adapter instances
+_TYPE_MAP = MappingProxyType({
+    str: 'VARCHAR',
+    int: 'BIGINT',
+    float: 'DOUBLE PRECISION',
+    bool: 'BOOLEAN',
+    bytes: 'BYTEA',
+    Decimal: 'NUMERIC',
+    date: 'DATE',
+    datetime: 'TIMESTAMP',
+    time: 'TIME',
+})
+
 
 class PostgreSQLAdapter(DatabaseAdapter):
     """Adapter for PostgreSQL databases."""
 
-    @property
-    def type_map(self) -> dict[type, str]:
-        """Map Python types to PostgreSQL types."""
-        return {
-            str: 'VARCHAR',
-            int: 'BIGINT',
-            float: 'DOUBLE PRECISION',
-            bool: 'BOOLEAN',
-            bytes: 'BYTEA',
-            Decimal: 'NUMERIC',
-            date: 'DATE',
-            datetime: 'TIMESTAMP',
-            time: 'TIME',
-        }
+    # Map Python types to PostgreSQL types
+    type_map = _TYPE_MAP
+
+    # Bind parameters per statement in the PostgreSQL wire protocol
+    max_params = 65535
 
     def get_current_schema(self, cursor: Any, table_name: str) -> dict:
         """
@@ -67,6 +72,37 @@ class PostgreSQLAdapter(DatabaseAdapter):
 
         return schema
 
+    def get_current_schemas(self, cursor: Any, table_names: Iterable[str]) -> dict[str, dict]:
+        """
+        Get current schemas of several tables from PostgreSQL.
+
+        Retrieves the columns of all tables with one information_schema query.
+        """
+        table_names = list(table_names)
+        schemas = {name: {} for name in table_names}
+        if not table_names:
+            return schemas
+
+        cursor.execute(
+            """
+            SELECT table_name, column_name, data_type, is_nullable, column_default
+            FROM information_schema.columns
+            WHERE table_name = ANY(%s)
+            ORDER BY table_name, ordinal_position
+            """,
+            (table_names,)
+        )
+
+        for row in cursor.fetchall():
+            schemas[row['table_name']][row['column_name']] = {
+                'name': row['column_name'],
+                'type': row['data_type'],
+                'notnull': 1 if row['is_nullable'] == 'NO' else 0,
+                'dflt_value': row['column_default'],
+            }
+
+        return schemas
+
     def supports_drop_column(self) -> bool:
         """PostgreSQL supports DROP COLUMN."""
         return True
@@ -92,6 +128,32 @@ class PostgreSQLAdapter(DatabaseAdapter):
         )
         return cursor.fetchone()[0]
 
+    def _tables_exist(self, cursor: Any, table_names: Iterable[str]) -> set[str]:
+        """Check which of several tables exist in PostgreSQL database, with one query."""
+        table_names = list(table_names)
+        if not table_names:
+            return set()
+
+        cursor.execute(
+            """
+            SELECT table_name FROM information_schema.tables
+            WHERE table_name = ANY(%s)
+            """,
+            (table_names,)
+        )
+        return {row[0] for row in cursor.fetchall()}
+
+    def _execute_add_columns(self, cursor: Any, table_name: str, clauses: list[str]) -> list[str]:
+        """
+        Add columns to an existing PostgreSQL table.
+
+        PostgreSQL accepts several ADD COLUMN actions in one ALTER TABLE,
+        applied in a single pass over the table.
+        """
+        sql = f"ALTER TABLE {table_name} {', '.join(clauses)}"
+        cursor.execute(sql)
+        return [sql]
+
     def _drop_columns(self, cursor: Any, table: Any, columns: set[str]) -> list[str]:
         """
         Drop columns from PostgreSQL table.
@@ -15,30 +15,41 @@
 
 """SQLite database adapter."""
 
+import sqlite3
 from datetime import date, datetime, time
 from decimal import Decimal
+from types import MappingProxyType
 from typing import Any
 
 from .base import DatabaseAdapter
 
+# Python types to SQLite types, shared by all adapter instances
+_TYPE_MAP = MappingProxyType({
+    str: 'TEXT',
+    int: 'INTEGER',
+    float: 'REAL',
+    bool: 'INTEGER',
+    bytes: 'BLOB',
+    Decimal: 'NUMERIC',
+    date: 'DATE',
+    datetime: 'TIMESTAMP',
+    time: 'TIME',
+})
+
 
 class SQLiteAdapter(DatabaseAdapter):
     """Adapter for SQLite databases."""
 
-    @property
-    def type_map(self) -> dict[type, str]:
-        """Map Python types to SQLite types."""
-        return {
-            str: 'TEXT',
-            int: 'INTEGER',
-            float: 'REAL',
-            bool: 'INTEGER',
-            bytes: 'BLOB',
-            Decimal: 'NUMERIC',
-            date: 'DATE',
-            datetime: 'TIMESTAMP',
-            time: 'TIME',
-        }
+    # Map Python types to SQLite types
+    type_map = _TYPE_MAP
+
+    # SQLITE_MAX_VARIABLE_NUMBER default, raised from 999 in 3.32.0
+    max_params = 32766 if sqlite3.sqlite_version_info >= (3, 32, 0) else 999
+
+    def __init__(self):
+        super().__init__()
+        # ALTER TABLE ... DROP COLUMN is available since SQLite 3.35.0
+        self._supports_drop = sqlite3.sqlite_version_info >= (3, 35, 0)
 
     def get_current_schema(self, cursor: Any, table_name: str) -> dict:
         """
@@ -55,9 +66,7 @@ class SQLiteAdapter(DatabaseAdapter):
 
         For older versions, table rebuild is required.
         """
-        # For now return False to use safe rebuild method
-        # Can be enhanced to check SQLite version
-        return False
+        return self._supports_drop
 
     def get_autoincrement_syntax(self) -> str:
         """Get AUTOINCREMENT syntax for SQLite."""
@@ -75,8 +84,30 @@ class SQLiteAdapter(DatabaseAdapter):
         """
         Drop columns from SQLite table.
 
-        SQLite doesn't support DROP COLUMN directly (pre-3.35),
-        so we rebuild the table without those columns.
+        With SQLite 3.35+ each column is dropped with its own ALTER TABLE
+        (one action per statement). Older versions, and columns SQLite
+        refuses to drop (keys, indexed or constrained columns), fall back
+        to rebuilding the table without those columns.
+        """
+        if not self._supports_drop:
+            return self._rebuild_without_columns(cursor, table, columns)
+
+        migrations = []
+        try:
+            for col_name in sorted(columns):
+                sql = f"ALTER TABLE {table.sql_name} DROP COLUMN {col_name}"
+                cursor.execute(sql)
+                migrations.append(sql)
+        except sqlite3.OperationalError:
+            migrations.extend(self._rebuild_without_columns(cursor, table, columns))
+
+        return migrations
+
+    def _rebuild_without_columns(self, cursor: Any, table: Any, columns: set[str]) -> list[str]:
+        """
+        Rebuild SQLite table without the given columns.
+
+        This is the SQLite workaround for DROP COLUMN (pre-3.35.0).
         """
         from typing import TYPE_CHECKING
         if TYPE_CHECKING:
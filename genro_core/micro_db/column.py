@@ -15,11 +15,55 @@
 
 """Column definition with metadata and lazy type resolution."""
 
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 
 from ..lib import get_type_catalog
 
 
+def _parse_size(size: Any) -> tuple[str, Any]:
+    """
+    Classify a size specification once, at column definition.
+
+    Returns:
+        Tuple of (kind, argument):
+        - None → ('none', None)
+        - 5 → ('int', 5)
+        - '1:10' → ('range', '10')
+        - '10,2' → ('precscale', '10,2')
+        - anything else → ('str', size)
+    """
+    if size is None:
+        return 'none', None
+    if isinstance(size, int):
+        return 'int', size
+    if isinstance(size, str):
+        if ':' in size:
+            return 'range', size.split(':', 1)[1]
+        if ',' in size:
+            return 'precscale', size
+    return 'str', size
+
+
+# SQL type with size applied, by (dtype, size kind); other pairs keep the base type
+_SIZED_SQL_TYPES: dict[tuple[str, str], Callable[[Any], str]] = {
+    ('C', 'int'): 'CHAR({})'.format,
+    ('C', 'range'): 'VARCHAR({})'.format,
+    ('C', 'precscale'): 'CHAR({})'.format,
+    ('C', 'str'): 'CHAR({})'.format,
+    ('T', 'int'): 'VARCHAR({})'.format,
+    ('T', 'range'): 'VARCHAR({})'.format,
+    ('N', 'precscale'): 'NUMERIC({})'.format,
+}
+
+
+def _apply_size(dtype: str, size_kind: str, size_arg: Any, base_type: str) -> str:
+    """Apply a parsed size to the base SQL type of dtype."""
+    formatter = _SIZED_SQL_TYPES.get((dtype, size_kind))
+    if formatter is None:
+        return base_type
+    return formatter(size_arg)
+
+
 class Column:
     """
     Column definition with Genropy type system.
@@ -33,8 +77,18 @@ class Column:
         size: Size specification (for CHAR/VARCHAR/NUMERIC)
         not_null: If True, column cannot be NULL
         default: Default value
+        python_type: Python type of dtype (lazy, cached)
+        sql_type: SQL type of dtype with size applied (lazy, cached)
     """
 
+    # python_type and sql_type are left unset by __init__ and filled on
+    # first access by __getattr__, then read straight from their slots
+    __slots__ = (
+        'name', 'sql_name', 'dtype', 'name_long', 'name_plural', 'size',
+        'not_null', 'default', 'metadata', 'python_type', 'sql_type',
+        '_size_kind', '_size_arg',
+    )
+
     def __init__(
         self,
         name: str,
@@ -53,67 +107,43 @@ class Column:
         self.name_long = name_long
         self.name_plural = name_plural
         self.size = size
+        self._size_kind, self._size_arg = _parse_size(size)
         self.not_null = not_null
         self.default = default
         self.metadata = metadata
 
-        # Cache for lazy properties
-        self._python_type = None
-        self._sql_type = None
-
-    @property
-    def python_type(self) -> type:
+    def __getattr__(self, name: str) -> Any:
+        """Resolve python_type and sql_type on first access (lazy, cached)."""
+        if name == 'python_type':
+            value = self._resolve_python_type()
+        elif name == 'sql_type':
+            value = self._resolve_sql_type()
+        else:
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+        setattr(self, name, value)
+        return value
+
+    def _resolve_python_type(self) -> type:
         """
-        Get Python type for this column (lazy, cached).
+        Get Python type for this column.
 
         Uses TypeCatalog to convert Genropy dtype to Python type.
         """
-        if self._python_type is None:
-            catalog = get_type_catalog()
-            self._python_type = catalog.get_python_type(self.dtype)
-        return self._python_type
+        catalog = get_type_catalog()
+        return catalog.get_python_type(self.dtype)
 
-    @property
-    def sql_type(self) -> str:
+    def _resolve_sql_type(self) -> str:
         """
-        Get SQL type for this column (lazy, cached).
+        Get SQL type for this column.
 
         Uses TypeCatalog to convert Genropy dtype to SQL type,
         applying size if present.
         """
-        if self._sql_type is None:
-            catalog = get_type_catalog()
-            base_type = catalog.get_sql_type(self.dtype)
-
-            # Apply size specification
-            if self.size is not None:
-                if self.dtype == 'C':
-                    # CHAR with fixed size
-                    if isinstance(self.size, int):
-                        self._sql_type = f'CHAR({self.size})'
-                    else:
-                        self._sql_type = f'CHAR({self.size})'
-                elif self.dtype == 'T':
-                    # VARCHAR with range
-                    if isinstance(self.size, str) and ':' in self.size:
-                        _, max_len = self.size.split(':')
-                        self._sql_type = f'VARCHAR({max_len})'
-                    elif isinstance(self.size, int):
-                        self._sql_type = f'VARCHAR({self.size})'
-                    else:
-                        self._sql_type = base_type
-                elif self.dtype == 'N':
-                    # NUMERIC with precision/scale
-                    if isinstance(self.size, str) and ',' in self.size:
-                        self._sql_type = f'NUMERIC({self.size})'
-                    else:
-                        self._sql_type = base_type
-                else:
-                    self._sql_type = base_type
-            else:
-                self._sql_type = base_type
-
-        return self._sql_type
+        catalog = get_type_catalog()
+        base_type = catalog.get_sql_type(self.dtype)
+
+        # Apply size specification, parsed in __init__
+        return _apply_size(self.dtype, self._size_kind, self._size_arg, base_type)
 
     def to_dict(self) -> dict:
         """Convert column to dictionary representation."""
@@ -18,6 +18,22 @@
 import re
 from typing import Any
 
+# $field_name references, replaced by the bare field name
+_FIELD_RE = re.compile(r'\$(\w+)')
+_FIELD_REPL = r'\1'
+
+# Commas in a column list, with the whitespace around them
+_COMMA_RE = re.compile(r'\s*,\s*')
+
+# Clauses shaping a SELECT, in SQL order after columns
+_SELECT_CLAUSE_ORDER = ('where', 'group_by', 'order_by', 'limit', 'offset')
+
+# compile_select() keyword arguments taken as clauses; others are SQL parameters
+_SELECT_CLAUSES = frozenset(('columns',) + _SELECT_CLAUSE_ORDER)
+
+# Maximum number of distinct SELECT shapes cached per compiler
+_SELECT_CACHE_SIZE = 256
+
 
 class GenroMicroCompiler:
     """
@@ -38,6 +54,8 @@ class GenroMicroCompiler:
         )
     """
 
+    __slots__ = ('table_name', 'templates', '_select_cache', '_select_all')
+
     def __init__(self, table_name: str):
         """Initialize compiler for a specific table."""
         self.table_name = table_name
@@ -47,20 +65,25 @@ class GenroMicroCompiler:
             'limit': 'LIMIT {}',
             'offset': 'OFFSET {}'
         }
+        # Compiled SELECT statements by (columns, *clauses in SQL order)
+        self._select_cache: dict[tuple, str] = {}
+        self._select_all = f'SELECT * FROM {table_name}'
 
     def _extract_fields(self, text: str) -> str:
         """Replace $field_name with field_name."""
-        if not text:
+        # Plain SQL fragments ('*', 'id ASC', ...) skip the regex
+        if not text or '$' not in text:
             return text
-        return re.sub(r'\$(\w+)', r'\1', text)
+        return _FIELD_RE.sub(_FIELD_REPL, text)
 
     def compile_columns(self, columns: str | None) -> str:
         """Compile SELECT columns clause."""
         if columns is None or columns == '*':
             return 'SELECT *'
 
-        col_list = [self._extract_fields(col.strip()) for col in columns.split(',')]
-        return f"SELECT {', '.join(col_list)}"
+        # Normalize to ', ' separators and strip $ sigils in two passes
+        col_list = _COMMA_RE.sub(', ', columns.strip())
+        return f"SELECT {self._extract_fields(col_list)}"
 
     def compile_where(self, where: str, sql_params: dict) -> str:
         """Compile WHERE clause."""
@@ -101,18 +124,54 @@ class GenroMicroCompiler:
             # Returns:
             # sql = "SELECT id, COALESCE(title, :notitle) as Title FROM books WHERE shelf_code = :sc AND available = :avail ORDER BY title ASC"
             # params = {'sc': 'A1', 'avail': True, 'notitle': 'Untitled Book'}
+
+        The SQL depends only on the clauses, not on parameter values, so it
+        is cached per combination of clauses: repeated queries with new
+        values reuse it.
         """
-        clauses = []
         sql_params = {}
 
         # Separate SQL clauses from parameters
         clause_data = {}
         for name, value in kwargs.items():
-            if name in self.templates or hasattr(self, f'compile_{name}'):
+            if name in _SELECT_CLAUSES:
                 clause_data[name] = value
             else:
                 sql_params[name] = value
 
+        # No clauses at all: plain SELECT *
+        if not clause_data:
+            return self._select_all, sql_params
+
+        key = (clause_data.get('columns'),) + tuple(
+            clause_data.get(name) for name in _SELECT_CLAUSE_ORDER
+        )
+        try:
+            sql = self._select_cache.get(key)
+        except TypeError:
+            # Unhashable clause values are compiled on every call
+            return self._build_select(clause_data, sql_params), sql_params
+
+        if sql is None:
+            sql = self._build_select(clause_data, sql_params)
+            if len(self._select_cache) < _SELECT_CACHE_SIZE:
+                self._select_cache[key] = sql
+
+        return sql, sql_params
+
+    def _build_select(self, clause_data: dict, sql_params: dict) -> str:
+        """
+        Build the SELECT statement for the given clauses.
+
+        Args:
+            clause_data: SQL clauses by name (columns, where, order_by, ...)
+            sql_params: SQL parameters, passed to compile_<clause> handlers
+
+        Returns:
+            SQL string
+        """
+        clauses = []
+
         # Build SELECT clause (always first)
         columns = clause_data.get('columns')
         clauses.append(self.compile_columns(columns))
@@ -121,30 +180,23 @@ class GenroMicroCompiler:
         clauses.append(f'FROM {self.table_name}')
 
         # Build other clauses in SQL order
-        clause_order = ['where', 'group_by', 'order_by', 'limit', 'offset']
-
-        for name in clause_order:
+        for name in _SELECT_CLAUSE_ORDER:
             value = clause_data.get(name)
             if value is None:
                 continue
 
-            # Check if it's a template
-            if name in self.templates:
+            # WHERE has its own handler, the other clauses are templates
+            if name == 'where':
+                clause = self.compile_where(value, sql_params)
+                if clause:
+                    clauses.append(clause)
+            else:
                 processed_value = self._extract_fields(str(value))
                 clause = self.templates[name].format(processed_value)
                 clauses.append(clause)
-            else:
-                # Use handler method
-                handler = getattr(self, f'compile_{name}', None)
-                if handler:
-                    clause = handler(value, sql_params)
-                    if clause:
-                        clauses.append(clause)
 
         # Combine SQL
-        sql = ' '.join(clauses)
-
-        return sql, sql_params
+        return ' '.join(clauses)
 
     def compile_insert(self, table: Any, record: dict) -> tuple[str, tuple]:
         """
@@ -161,9 +213,8 @@ class GenroMicroCompiler:
             sql, values = compiler.compile_insert(table, {'title': 'Book', 'author': 'Author'})
             # Returns: ("INSERT INTO books (title, author) VALUES (?, ?)", ('Book', 'Author'))
         """
-        field_names = list(record.keys())
-        placeholders = ','.join(['?'] * len(field_names))
-        fields_str = ','.join(field_names)
+        placeholders = ','.join('?' * len(record))
+        fields_str = ','.join(record)
 
         sql = f"INSERT INTO {self.table_name} ({fields_str}) VALUES ({placeholders})"
         values = tuple(record.values())
@@ -206,6 +257,48 @@ class GenroMicroCompiler:
 
         return sql, tuple(values)
 
+    def compile_update_many(
+        self, table: Any, field_names: list[str], pk_field: str, records: list[dict]
+    ) -> tuple[str, tuple]:
+        """
+        Compile one UPDATE statement setting per-record values on several records.
+
+        Args:
+            table: Table instance
+            field_names: Fields to set (excluding pk), present in every record
+            pk_field: Primary key field name
+            records: Dictionaries of field values, including pk
+
+        Returns:
+            Tuple of (sql_string, values_tuple)
+
+        Example:
+            sql, values = compiler.compile_update_many(
+                table, ['title'], 'id', [{'id': 1, 'title': 'A'}, {'id': 2, 'title': 'B'}]
+            )
+            # Returns: ("UPDATE books SET title = CASE id WHEN ? THEN ? WHEN ? THEN ? "
+            #           "ELSE title END WHERE id IN (?,?)", (1, 'A', 2, 'B', 1, 2))
+        """
+        whens = ' '.join(['WHEN ? THEN ?'] * len(records))
+        pk_values = [record[pk_field] for record in records]
+
+        # Build SET clause: one CASE per field, binding (pk, value) pairs
+        set_parts = []
+        values = []
+        for field in field_names:
+            set_parts.append(f"{field} = CASE {pk_field} {whens} ELSE {field} END")
+            for pk_value, record in zip(pk_values, records):
+                values.append(pk_value)
+                values.append(record[field])
+
+        set_clause = ", ".join(set_parts)
+        placeholders = ','.join('?' * len(records))
+        values.extend(pk_values)
+
+        sql = f"UPDATE {self.table_name} SET {set_clause} WHERE {pk_field} IN ({placeholders})"
+
+        return sql, tuple(values)
+
     def compile_delete(self, table: Any, pk_field: str, pk_value: Any) -> tuple[str, tuple]:
         """
         Compile a DELETE statement.
@@ -15,18 +15,22 @@
 
 """GenroMicroDb - Database management for micro applications."""
 
-import _thread
 import sqlite3
-from contextlib import contextmanager
+import threading
 from typing import Any, Type
 from urllib.parse import urlparse
 
 from .adapters import DatabaseAdapter, SQLiteAdapter, PostgreSQLAdapter
 
+# Marks keys absent from currentEnv
+_MISSING = object()
+
 
 class TablesRegistry:
     """Registry for database tables with dict-like access using singular names."""
 
+    __slots__ = ('_tables',)
+
     def __init__(self):
         self._tables = {}
 
@@ -42,10 +46,13 @@ class TablesRegistry:
 
     def __getattr__(self, name: str) -> Any:
         """Access table by singular name as attribute."""
+        # Private names first: _tables is looked up here while unset (copy, pickle)
         if name.startswith('_'):
             raise AttributeError(f"'{self.__class__.__name__}' object has no attribute '{name}'")
-        if name in self._tables:
+        try:
             return self._tables[name]
+        except KeyError:
+            pass
         raise AttributeError(f"Table '{name}' not found. Available: {list(self._tables.keys())}")
 
     def __getitem__(self, name: str) -> Any:
@@ -81,6 +88,8 @@ class TempEnv:
             db.tables.mytable.insert(record=data)
     """
 
+    __slots__ = ('db', 'kwargs', 'savedValues', 'addedKeys')
+
     def __init__(self, db: "GenroMicroDb", **kwargs):
         """
         Initialize temporary environment.
@@ -102,14 +111,17 @@ class TempEnv:
             Database instance for chaining
         """
         currentEnv = self.db.currentEnv
+        savedValues = self.savedValues
+        addedKeys = self.addedKeys
 
         for k, v in self.kwargs.items():
-            if k in currentEnv:
-                # Save existing value
-                self.savedValues[k] = currentEnv.get(k)
-            else:
+            old = currentEnv.get(k, _MISSING)
+            if old is _MISSING:
                 # Track new key
-                self.addedKeys.append((k, v))
+                addedKeys.append((k, v))
+            else:
+                # Save existing value
+                savedValues[k] = old
             # Set new value
             currentEnv[k] = v
 
@@ -135,6 +147,29 @@ class TempEnv:
         currentEnv.update(self.savedValues)
 
 
+class CursorContext:
+    """
+    Context manager opening a cursor on enter and closing it on exit.
+
+    A plain class rather than a @contextmanager generator, since cursors
+    are opened for every statement.
+    """
+
+    __slots__ = ('connection', '_cursor')
+
+    def __init__(self, connection: sqlite3.Connection):
+        self.connection = connection
+        self._cursor = None
+
+    def __enter__(self):
+        self._cursor = self.connection.cursor()
+        return self._cursor
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._cursor.close()
+        self._cursor = None
+
+
 class GenroMicroDb:
     """
     Database abstraction for micro applications.
@@ -143,8 +178,8 @@ class GenroMicroDb:
     Supports multiple database implementations (SQLite, PostgreSQL, etc.)
     """
 
-    # Class-level thread-local environment storage
-    _currentEnvByThread = {}
+    # Class-level thread-local environment storage, freed when threads exit
+    _currentEnvLocal = threading.local()
 
     def __init__(
         self,
@@ -181,8 +216,6 @@ class GenroMicroDb:
 
         # Store connection parameters for lazy initialization
         self._connection_string = connection_string
-        self._implementation = implementation
-        self._path = path
         self._host = host
         self._port = port
         self._database = database
@@ -193,19 +226,15 @@ class GenroMicroDb:
         if not connection_string and not implementation:
             raise ValueError("Either connection_string or implementation must be provided")
 
-    def _connect_from_string(self, connection_string: str) -> None:
-        """Parse connection string and establish connection."""
-        parsed = urlparse(connection_string)
-        implementation = parsed.scheme
-
-        if implementation == "sqlite":
+        # Resolve implementation and SQLite path once; the connection string wins
+        if connection_string:
+            parsed = urlparse(connection_string)
             # sqlite:///path/to/db.sqlite or sqlite:///:memory:
-            db_path = parsed.path.lstrip('/')
-            if not db_path:
-                db_path = ":memory:"
-            self._connect_sqlite(db_path)
+            self._resolved_implementation = parsed.scheme
+            self._resolved_path = parsed.path.lstrip('/') or ":memory:"
         else:
-            raise NotImplementedError(f"Database implementation '{implementation}' not yet supported")
+            self._resolved_implementation = implementation
+            self._resolved_path = path or ":memory:"
 
     def _connect_from_params(
         self,
@@ -241,27 +270,14 @@ class GenroMicroDb:
         Creates and caches the database connection on first access.
         """
         if self._connection is None:
-            # Create connection from stored parameters
-            if self._connection_string:
-                parsed = urlparse(self._connection_string)
-                implementation = parsed.scheme
-
-                if implementation == "sqlite":
-                    db_path = parsed.path.lstrip('/')
-                    if not db_path:
-                        db_path = ":memory:"
-                    self._connection = self._connect_sqlite(db_path)
-                else:
-                    raise NotImplementedError(f"Database implementation '{implementation}' not yet supported")
-
-            elif self._implementation:
-                if self._implementation == "sqlite":
-                    db_path = self._path or ":memory:"
-                    self._connection = self._connect_sqlite(db_path)
-                elif self._implementation == "postgresql":
-                    raise NotImplementedError("PostgreSQL support coming soon")
-                else:
-                    raise NotImplementedError(f"Database implementation '{self._implementation}' not yet supported")
+            # Create connection from resolved parameters
+            implementation = self._resolved_implementation
+            if implementation == "sqlite":
+                self._connection = self._connect_sqlite(self._resolved_path)
+            elif implementation == "postgresql":
+                raise NotImplementedError("PostgreSQL support coming soon")
+            else:
+                raise NotImplementedError(f"Database implementation '{implementation}' not yet supported")
 
         return self._connection
 
@@ -273,14 +289,7 @@ class GenroMicroDb:
         Creates and caches the database adapter on first access.
         """
         if self._adapter is None:
-            # Determine implementation type
-            implementation = None
-
-            if self._connection_string:
-                parsed = urlparse(self._connection_string)
-                implementation = parsed.scheme
-            elif self._implementation:
-                implementation = self._implementation
+            implementation = self._resolved_implementation
 
             # Create appropriate adapter
             if implementation == "sqlite":
@@ -292,8 +301,7 @@ class GenroMicroDb:
 
         return self._adapter
 
-    @contextmanager
-    def cursor(self):
+    def cursor(self) -> CursorContext:
         """
         Context manager for database cursor.
 
@@ -304,11 +312,7 @@ class GenroMicroDb:
             with db.cursor() as cursor:
                 cursor.execute("SELECT * FROM table")
         """
-        cursor = self.connection.cursor()
-        try:
-            yield cursor
-        finally:
-            cursor.close()
+        return CursorContext(self.connection)
 
     def add_table(self, table_class: Type) -> None:
         """
@@ -330,12 +334,17 @@ class GenroMicroDb:
 
         Returns:
             Dictionary mapping table names to list of SQL statements executed
+
+        Each table is migrated by its own migrate(), so subclasses can
+        override it. Existing tables and their schemas are read for all
+        tables at once beforehand, and changes are committed together.
         """
         results = {}
-        for table_name, table_instance in self.tables.items():
-            migrations = table_instance.migrate(drop_columns=drop_columns)
-            if migrations:
-                results[table_name] = migrations
+        with self.adapter.prefetched_schemas(list(self.tables.values())):
+            for table_name, table_instance in self.tables.items():
+                migrations = table_instance.migrate(drop_columns=drop_columns)
+                if migrations:
+                    results[table_name] = migrations
         return results
 
     @property
@@ -349,10 +358,11 @@ class GenroMicroDb:
         Returns:
             Dictionary for current thread
         """
-        thread_id = _thread.get_ident()
-        if thread_id not in self._currentEnvByThread:
-            self._currentEnvByThread[thread_id] = {}
-        return self._currentEnvByThread[thread_id]
+        try:
+            return self._currentEnvLocal.env
+        except AttributeError:
+            env = self._currentEnvLocal.env = {}
+            return env
 
     def tempEnv(self, **kwargs) -> TempEnv:
         """
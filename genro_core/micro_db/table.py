@@ -16,8 +16,9 @@
 """Base class for automatic CRUD operations with introspection."""
 
 import sqlite3
-from contextlib import contextmanager
 from dataclasses import fields, is_dataclass, MISSING
+from datetime import date, datetime, time
+from decimal import Decimal
 from typing import Any, Annotated, get_type_hints, get_origin, get_args, TYPE_CHECKING
 
 from ..enablers import apiready
@@ -25,7 +26,29 @@ from .column import Column
 from .trigger_stack import in_triggerstack
 
 if TYPE_CHECKING:
-    from .database import GenroMicroDb
+    from .database import CursorContext, GenroMicroDb
+
+# Map Python types to Genropy dtypes
+_DTYPE_MAP = {
+    str: 'T',      # TEXT/VARCHAR
+    int: 'L',      # Long/INTEGER
+    float: 'R',    # Real/FLOAT
+    Decimal: 'N',  # Numeric/DECIMAL
+    date: 'D',     # Date
+    datetime: 'DH', # DateTime with hour
+    time: 'H',     # Hour/Time
+    bool: 'B',     # Boolean
+    bytes: 'BLOB', # Binary data
+}
+
+# Map Python types to SQLite types for the Columns dataclass
+_SQL_TYPE_MAP = {
+    int: "INTEGER",
+    str: "TEXT",
+    float: "REAL",
+    bool: "INTEGER",
+    bytes: "BLOB",
+}
 
 
 class Table:
@@ -65,6 +88,11 @@ class Table:
     _icon: str = ""
     _description: str = ""
 
+    # Bumped when columns are added; adapters cache schemas derived from them
+    _cols_version: int = 0
+    _desired_schema_cache: tuple | None = None
+    _create_sql_cache: tuple | None = None
+
     def __init__(self, db: "GenroMicroDb"):
         """
         Initialize table.
@@ -131,9 +159,6 @@ class Table:
         Returns:
             Genropy type code ('T', 'L', 'N', 'D', etc.)
         """
-        from decimal import Decimal
-        from datetime import date, datetime, time
-
         # Handle Optional types
         origin = get_origin(py_type)
         if origin is not None:
@@ -141,20 +166,7 @@ class Table:
             if len(args) > 0:
                 py_type = args[0]  # Get the actual type from Optional[T]
 
-        # Map Python types to Genropy dtypes
-        type_map = {
-            str: 'T',      # TEXT/VARCHAR
-            int: 'L',      # Long/INTEGER
-            float: 'R',    # Real/FLOAT
-            Decimal: 'N',  # Numeric/DECIMAL
-            date: 'D',     # Date
-            datetime: 'DH', # DateTime with hour
-            time: 'H',     # Hour/Time
-            bool: 'B',     # Boolean
-            bytes: 'BLOB', # Binary data
-        }
-
-        return type_map.get(py_type, 'T')  # Default to TEXT
+        return _DTYPE_MAP.get(py_type, 'T')  # Default to TEXT
 
     def _extract_columns_from_dataclass(self) -> None:
         """Extract column definitions from Columns dataclass into self.columns."""
@@ -178,6 +190,7 @@ class Table:
                 not_null=not_null,
                 default=default
             )
+        self._cols_version += 1
 
     def add_column(
         self,
@@ -226,6 +239,7 @@ class Table:
             default=default,
             **metadata
         )
+        self._cols_version += 1
 
     def _apply_api_decorators(self) -> None:
         """
@@ -253,8 +267,7 @@ class Table:
         """Convert database row to dictionary."""
         return dict(row)
 
-    @contextmanager
-    def cursor(self):
+    def cursor(self) -> "CursorContext":
         """
         Context manager for database cursor.
 
@@ -264,8 +277,7 @@ class Table:
             with self.cursor() as cursor:
                 cursor.execute("SELECT * FROM table")
         """
-        with self.db.cursor() as cursor:
-            yield cursor
+        return self.db.cursor()
 
     def _type_to_sql(self, py_type) -> str:
         """Map Python type to SQL type."""
@@ -276,14 +288,7 @@ class Table:
             if len(args) > 0:
                 py_type = args[0]  # Get the actual type from Optional[T]
 
-        type_mapping = {
-            int: "INTEGER",
-            str: "TEXT",
-            float: "REAL",
-            bool: "INTEGER",
-            bytes: "BLOB",
-        }
-        return type_mapping.get(py_type, "TEXT")
+        return _SQL_TYPE_MAP.get(py_type, "TEXT")
 
     def _generate_create_table_sql(self) -> str:
         """Generate CREATE TABLE SQL from Columns dataclass."""
@@ -568,6 +573,31 @@ class Table:
         self.trigger_onInserted(record)
         return result
 
+    @in_triggerstack
+    def insert_many(self, records: list[dict]) -> int:
+        """
+        Insert several records into the table in a single transaction.
+
+        Each record goes through primary key generation, validation and
+        trigger_onInserting before the batch is written, then through
+        trigger_onInserted. Keys generated by the database (auto-increment)
+        are set in the records before trigger_onInserted.
+
+        Args:
+            records: List of dictionaries of field values
+
+        Returns:
+            Number of inserted records
+        """
+        for record in records:
+            self.checkPkey(record)
+            self._validate(record)
+            self.trigger_onInserting(record)
+        result = self.db.adapter.insert_many(self, records)
+        for record in records:
+            self.trigger_onInserted(record)
+        return result
+
     @in_triggerstack
     @apiready
     def update(self, record=None, oldRecord=None) -> dict:
@@ -577,6 +607,41 @@ class Table:
         self.trigger_onUpdated(record, oldRecord)
         return result
 
+    @in_triggerstack
+    def update_many(self, records: list[dict]) -> int:
+        """
+        Update several records in a single transaction.
+
+        Each record goes through trigger_onUpdating before the batch is
+        written, then through trigger_onUpdated. Both receive the stored
+        record as oldRecord, read for all records at once, or None if no
+        record has that primary key.
+
+        Args:
+            records: List of record dictionaries, each with a distinct primary key
+
+        Returns:
+            Number of updated rows
+
+        Raises:
+            ValueError: If a record has no primary key, or a primary key repeats
+        """
+        pkey = self.pkey
+        for record in records:
+            if pkey not in record:
+                raise ValueError(f"Primary key '{pkey}' not found in record")
+        pks = [record[pkey] for record in records]
+        if len(set(pks)) != len(pks):
+            raise ValueError(f"Duplicate primary key values in records for {self.name}")
+
+        old_records = self._get_many(pks)
+        for record in records:
+            self.trigger_onUpdating(record, old_records.get(record[pkey]))
+        result = self.db.adapter.update_many(self, records)
+        for record in records:
+            self.trigger_onUpdated(record, old_records.get(record[pkey]))
+        return result
+
     @in_triggerstack
     @apiready
     def delete(self, record=None) -> None:
@@ -611,6 +676,31 @@ class Table:
 
             return self._row_to_dict(row)
 
+    def _get_many(self, pks: list) -> dict[Any, dict]:
+        """
+        Get several records by primary key, with one IN (...) query per batch.
+
+        Args:
+            pks: Primary key values
+
+        Returns:
+            Dictionary mapping primary key to record, for records found
+        """
+        records = {}
+        size = self.db.adapter.max_params
+        with self.cursor() as cursor:
+            for start in range(0, len(pks), size):
+                batch = pks[start:start + size]
+                placeholders = ','.join('?' * len(batch))
+                cursor.execute(
+                    f"SELECT * FROM {self.sql_name} WHERE {self.pkey} IN ({placeholders})",
+                    tuple(batch)
+                )
+                for row in cursor.fetchall():
+                    record = self._row_to_dict(row)
+                    records[record[self.pkey]] = record
+        return records
+
     @apiready
     def list(self, **filters) -> list[dict]:
         """
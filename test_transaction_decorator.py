@@ -33,23 +33,23 @@ def test_transaction_metadata():
     # Test read_method (default transaction=False)
     print("\n1. Testing read_method (default)...")
     metadata = TestTable.read_method._api_metadata
-    assert "transaction" in metadata, "transaction key missing from metadata"
-    assert metadata["transaction"] == False, f"Expected False, got {metadata['transaction']}"
-    print(f"   ✓ read_method: transaction={metadata['transaction']}")
+    assert hasattr(metadata, "transaction"), "transaction field missing from metadata"
+    assert metadata.transaction == False, f"Expected False, got {metadata.transaction}"
+    print(f"   ✓ read_method: transaction={metadata.transaction}")
 
     # Test write_method (explicit transaction=True)
     print("\n2. Testing write_method (transaction=True)...")
     metadata = TestTable.write_method._api_metadata
-    assert "transaction" in metadata, "transaction key missing from metadata"
-    assert metadata["transaction"] == True, f"Expected True, got {metadata['transaction']}"
-    print(f"   ✓ write_method: transaction={metadata['transaction']}")
+    assert hasattr(metadata, "transaction"), "transaction field missing from metadata"
+    assert metadata.transaction == True, f"Expected True, got {metadata.transaction}"
+    print(f"   ✓ write_method: transaction={metadata.transaction}")
 
     # Test no_transaction_method (explicit transaction=False)
     print("\n3. Testing no_transaction_method (transaction=False)...")
     metadata = TestTable.no_transaction_method._api_metadata
-    assert "transaction" in metadata, "transaction key missing from metadata"
-    assert metadata["transaction"] == False, f"Expected False, got {metadata['transaction']}"
-    print(f"   ✓ no_transaction_method: transaction={metadata['transaction']}")
+    assert hasattr(metadata, "transaction"), "transaction field missing from metadata"
+    assert metadata.transaction == False, f"Expected False, got {metadata.transaction}"
+    print(f"   ✓ no_transaction_method: transaction={metadata.transaction}")
 
     print("\n" + "=" * 60)
     print("✓ ALL TRANSACTION TESTS PASSED!")
@@ -1,7 +1,11 @@
 """Tests for @apiready decorator."""
 
+import functools
+from typing import Any
+
 import pytest
 from genro_core.decorators import apiready
+from genro_core.enablers import get_api_metadata
 
 
 # Old-style: methods only (no class decorator)
@@ -62,59 +66,59 @@ def test_apiready_http_method_inference():
     """Test HTTP method inference from function name."""
     # read* should infer GET
     metadata = OldStyleBackend.read_text._api_metadata
-    assert metadata["http_method"] == "GET"
+    assert metadata.http_method == "GET"
 
     # write* should infer POST
     metadata = OldStyleBackend.write_bytes._api_metadata
-    assert metadata["http_method"] == "POST"
+    assert metadata.http_method == "POST"
 
 
 def test_apiready_explicit_method():
     """Test explicit HTTP method override."""
     # Explicitly set to POST even though name starts with 'get'
     metadata = OldStyleBackend.get_metadata._api_metadata
-    assert metadata["http_method"] == "POST"
+    assert metadata.http_method == "POST"
 
 
 def test_apiready_request_fields():
     """Test request field extraction."""
     metadata = OldStyleBackend.read_text._api_metadata
-    fields = metadata["request_fields"]
+    fields = metadata.request_fields
 
-    # Should have 'path' (required) and 'encoding' (optional with default)
-    assert "path" in fields
-    assert "encoding" in fields
+    # Should be a tuple of (name, type, default) triples, without 'self'
+    assert isinstance(fields, tuple)
+    assert [name for name, _, _ in fields] == ["path", "encoding"]
 
     # Check required vs optional
-    assert fields["path"] == (str, ...)  # Required (no default)
-    assert fields["encoding"] == (str, "utf-8")  # Optional with default
+    assert fields[0] == ("path", str, ...)  # Required (no default)
+    assert fields[1] == ("encoding", str, "utf-8")  # Optional with default
 
 
 def test_apiready_return_type():
     """Test return type extraction."""
     # read_text returns str
     metadata = OldStyleBackend.read_text._api_metadata
-    assert metadata["return_type"] == str
+    assert metadata.return_type == str
 
     # write_bytes returns None
     metadata = OldStyleBackend.write_bytes._api_metadata
-    assert metadata["return_type"] is type(None)
+    assert metadata.return_type is type(None)
 
     # get_metadata returns dict
     metadata = OldStyleBackend.get_metadata._api_metadata
-    assert metadata["return_type"] == dict
+    assert metadata.return_type == dict
 
 
 def test_apiready_endpoint_path():
     """Test endpoint path defaults to function name."""
     metadata = OldStyleBackend.read_text._api_metadata
-    assert metadata["endpoint_path"] == "/read_text"
+    assert metadata.endpoint_path == "/read_text"
 
 
 def test_apiready_docstring():
     """Test docstring is captured."""
     metadata = OldStyleBackend.read_text._api_metadata
-    assert metadata["docstring"] == "Read file as text."
+    assert metadata.docstring == "Read file as text."
 
 
 # New tests for class-level @apiready
@@ -134,13 +138,13 @@ def test_class_apiready_methods_have_metadata():
 def test_class_apiready_default_path():
     """Test that methods use function name as default path."""
     metadata = NewStyleBackend.read_text._api_metadata
-    assert metadata["endpoint_path"] == "/read_text"
+    assert metadata.endpoint_path == "/read_text"
 
 
 def test_class_apiready_custom_path():
     """Test that methods can override with custom path."""
     metadata = NewStyleBackend.write_bytes._api_metadata
-    assert metadata["endpoint_path"] == "/custom"
+    assert metadata.endpoint_path == "/custom"
 
 
 def test_class_apiready_requires_path():
@@ -156,3 +160,150 @@ def test_class_apiready_preserves_behavior():
     backend = NewStyleBackend()
     result = backend.read_text("/test.txt")
     assert result == "content of /test.txt"
+
+
+def test_get_api_metadata_through_wrappers():
+    """Test that get_api_metadata follows __wrapped__ chains."""
+    decorated = OldStyleBackend.read_text
+    assert get_api_metadata(decorated) is decorated._api_metadata
+
+    def outer(*args, **kwargs):
+        return decorated(*args, **kwargs)
+
+    outer.__wrapped__ = decorated
+    assert get_api_metadata(outer) is decorated._api_metadata
+    assert get_api_metadata(functools.wraps(decorated)(outer)) is decorated._api_metadata
+
+    def plain(self):
+        pass
+
+    assert get_api_metadata(plain) is None
+
+
+def test_apiready_request_fields_defaults():
+    """Test positional, keyword-only and variadic parameters in request fields."""
+
+    @apiready
+    def create(self, title: str, pages: int = 10, *, draft: bool = False, tag=None) -> dict:
+        pass
+
+    assert create._api_metadata.request_fields == (
+        ("title", str, ...),
+        ("pages", int, 10),
+        ("draft", bool, False),
+        ("tag", Any, None),
+    )
+
+    @apiready
+    def search(self, query: str, *args, limit: int, **kwargs) -> list:
+        pass
+
+    names = [name for name, _, _ in search._api_metadata.request_fields]
+    assert names == ["query", "args", "limit", "kwargs"]
+    assert search._api_metadata.request_fields[2] == ("limit", int, ...)
+
+
+def test_apiready_returns_function_itself():
+    """Test that @apiready attaches metadata without wrapping the function."""
+
+    def remove(self, title: str) -> bool:
+        return True
+
+    assert apiready(remove) is remove
+    assert remove._api_metadata.http_method == "POST"
+
+
+def test_apiready_type_hints_cached():
+    """Test that resolved type hints are reused when a function is re-decorated."""
+    from genro_core.enablers import api_publisher_enabler
+
+    def lookup(self, key: "str") -> "int":
+        pass
+
+    first = apiready(lookup)
+    hits = api_publisher_enabler._cached_type_hints.cache_info().hits
+    second = apiready(lookup)
+
+    assert api_publisher_enabler._cached_type_hints.cache_info().hits == hits + 1
+    assert first._api_metadata.request_fields == second._api_metadata.request_fields == (
+        ("key", str, ...),
+    )
+
+
+def test_apiready_type_info_precomputed():
+    """Test that parameter and return type information is built at decoration time."""
+    metadata = OldStyleBackend.read_text._api_metadata
+
+    assert metadata.parameters == {
+        "path": {"type": "str", "required": True},
+        "encoding": {"type": "str", "required": False, "default": "utf-8"},
+    }
+    assert metadata.return_type_info == {"type": "str"}
+
+
+def test_apiready_docstring_cleaned():
+    """Test that multi-line docstrings are cleaned at decoration time."""
+
+    @apiready
+    def get_item(self, key: str) -> dict:
+        """Get an item.
+
+            Indented details.
+        """
+
+    assert get_item._api_metadata.docstring == "Get an item.\n\nIndented details."
+
+
+def test_apiready_type_info_by_origin():
+    """Test type information of Annotated, Union and generic hints."""
+    from typing import Annotated, Optional
+
+    @apiready
+    def search(
+        self,
+        query: Annotated[str, "Search text"],
+        limit: Optional[int] = None,
+        tags: list[str] | None = None,
+    ) -> dict[str, list]:
+        pass
+
+    metadata = search._api_metadata
+    assert metadata.parameters["query"] == {
+        "type": "str", "description": "Search text", "required": True
+    }
+    assert metadata.parameters["limit"]["type"] == "int | None"
+    assert metadata.parameters["tags"]["type"] == "list | None"
+    assert metadata.return_type_info == {"type": "dict[str, list]"}
+
+
+def test_apiready_type_info_cached_per_hint():
+    """Test that type information is shared per hint but returned as new dicts."""
+    from genro_core.enablers import api_publisher_enabler
+
+    @apiready
+    def flag(self, on: bool = True, count: int = 1) -> list[bool]:
+        pass
+
+    @apiready
+    def toggle(self, on: bool = True, count: int = True) -> list[bool]:
+        pass
+
+    first = flag._api_metadata.parameters
+    second = toggle._api_metadata.parameters
+    assert first["on"] == second["on"] and first["on"] is not second["on"]
+    # 1 and True are equal but must not share a cache entry
+    assert first["count"]["default"] is not True
+    assert second["count"]["default"] is True
+    hits = api_publisher_enabler._cached_type_info.cache_info().hits
+    assert api_publisher_enabler._extract_type_info(list[bool]) == {"type": "list[bool]"}
+    assert api_publisher_enabler._cached_type_info.cache_info().hits == hits + 1
+
+
+def test_apiready_builtin_type_info():
+    """Test that builtin type hints are named without the type info cache."""
+    from genro_core.enablers import api_publisher_enabler
+
+    info = api_publisher_enabler._cached_type_info.cache_info()
+    for hint, name in [(str, "str"), (float, "float"), (bytes, "bytes"), (type(None), "None")]:
+        assert api_publisher_enabler._extract_type_info(hint) == {"type": name}
+    assert api_publisher_enabler._cached_type_info.cache_info() == info
@@ -0,0 +1,139 @@
+"""Tests for genro CLI subcommand discovery and dispatch."""
+
+import importlib
+import sys
+import types
+from importlib.metadata import EntryPoint
+
+import pytest
+
+# genro_core.cli re-exports main(), which shadows the submodule attribute
+cli = importlib.import_module("genro_core.cli.main")
+
+
+@pytest.fixture
+def plugins(monkeypatch):
+    """Install two fake plugins exposed through the genro.cli entry point group."""
+    loaded = []
+
+    def make_plugin(name):
+        module = types.ModuleType(f"fake_genro_{name}")
+
+        def register_parser(subparsers):
+            loaded.append(name)
+            sub = subparsers.add_parser(name)
+            sub.add_argument("--flag", action="store_true")
+
+        def execute(args):
+            module.executed = args
+
+        module.register_parser = register_parser
+        module.execute = execute
+        monkeypatch.setitem(sys.modules, module.__name__, module)
+        return module
+
+    modules = {name: make_plugin(name) for name in ("db", "web")}
+    eps = [
+        EntryPoint(name=name, value=module.__name__, group=cli.CLI_GROUP)
+        for name, module in modules.items()
+    ]
+
+    monkeypatch.setattr(cli, "entry_points", lambda group: eps)
+    monkeypatch.setattr(cli, "_entry_points", {})
+    monkeypatch.setattr(cli, "_handlers", {})
+    monkeypatch.setattr(cli, "_load_errors", {})
+    return modules, loaded
+
+
+def test_discover_subcommands_does_not_load(plugins):
+    """Discovery returns entry points without importing plugins."""
+    modules, loaded = plugins
+    subcommands = cli.discover_subcommands()
+
+    assert set(subcommands) == {"db", "web"}
+    assert all(isinstance(ep, EntryPoint) for ep in subcommands.values())
+    assert cli._handlers == {}
+
+
+def test_entry_points_are_cached(plugins, monkeypatch):
+    """Distribution metadata is scanned only once per process."""
+    cli.discover_subcommands()
+    monkeypatch.setattr(cli, "entry_points", lambda group: pytest.fail("rescanned"))
+    assert set(cli.discover_subcommands()) == {"db", "web"}
+
+
+def test_main_loads_only_selected_subcommand(plugins, monkeypatch):
+    """Only the dispatched plugin registers its parser and executes."""
+    modules, loaded = plugins
+    monkeypatch.setattr(sys, "argv", ["genro", "db", "--flag"])
+
+    cli.main()
+
+    assert loaded == ["db"]
+    assert modules["db"].executed.flag is True
+    assert not hasattr(modules["web"], "executed")
+
+
+def test_global_help_lists_commands_without_loading(plugins, monkeypatch, capsys):
+    """`genro --help` lists subcommands from entry points and imports nothing."""
+    modules, loaded = plugins
+    monkeypatch.setattr(sys, "argv", ["genro", "--help"])
+
+    with pytest.raises(SystemExit) as exc:
+        cli.main()
+
+    assert exc.value.code == 0
+    out = capsys.readouterr().out
+    assert "db" in out and "fake_genro_web" in out
+    assert loaded == []
+    assert cli._handlers == {}
+
+
+def test_unknown_subcommand(plugins, monkeypatch):
+    """An unknown subcommand is rejected without loading any plugin."""
+    monkeypatch.setattr(sys, "argv", ["genro", "nope"])
+
+    with pytest.raises(SystemExit) as exc:
+        cli.main()
+
+    assert exc.value.code == 2
+    assert cli._handlers == {}
+
+
+def test_subcommand_load_error_is_reported(plugins, monkeypatch, capsys):
+    """A plugin that fails to import is reported with its import error."""
+    broken = EntryPoint(name="broken", value="fake_genro_missing", group=cli.CLI_GROUP)
+    monkeypatch.setitem(cli._iter_entry_points(), "broken", broken)
+    monkeypatch.setattr(sys, "argv", ["genro", "broken"])
+
+    with pytest.raises(SystemExit) as exc:
+        cli.main()
+
+    assert exc.value.code == 2
+    err = capsys.readouterr().err
+    assert "failed to load subcommand 'broken'" in err
+    assert "fake_genro_missing" in err
+    assert "execute function" not in err
+
+
+def test_preload_subcommands_warns_on_load_error(plugins, monkeypatch, capsys):
+    """A single plugin failing to import is reported by preload_subcommands()."""
+    broken = EntryPoint(name="broken", value="fake_genro_missing", group=cli.CLI_GROUP)
+    monkeypatch.setitem(cli._iter_entry_points(), "broken", broken)
+
+    hooks = cli.preload_subcommands(["broken"])
+
+    assert hooks == {"broken": (None, None)}
+    err = capsys.readouterr().err
+    assert "Failed to load subcommand 'broken'" in err
+    assert "fake_genro_missing" in err
+
+
+def test_preload_subcommands(plugins):
+    """preload_subcommands() loads every plugin and returns its hooks."""
+    modules, loaded = plugins
+    hooks = cli.preload_subcommands()
+
+    assert set(hooks) == {"db", "web"}
+    assert hooks["db"] == (modules["db"].register_parser, modules["db"].execute)
+    assert set(cli._handlers) == {"db", "web"}
@@ -0,0 +1,477 @@
+"""Tests for micro_db adapters and tables."""
+
+from dataclasses import dataclass
+
+import pytest
+
+from genro_core import GenroMicroDb, Table
+
+
+class BookTable(Table):
+    sql_name = "books"
+
+    @dataclass
+    class Columns:
+        id: int
+        title: str
+        pages: int = 0
+
+
+@pytest.fixture
+def db():
+    db = GenroMicroDb(name="test_db", implementation="sqlite", path=":memory:")
+    db.add_table(BookTable)
+    db.migrate()
+    yield db
+    db.close()
+
+
+def test_insert_many(db):
+    """Records are inserted in one transaction, grouped by field set."""
+    records = [
+        {"title": "Dune", "pages": 412},
+        {"title": "Emma", "pages": 474},
+        {"title": "Ulysses"},
+        {"pages": 328, "title": "1984"},
+    ]
+
+    assert db.tables.book.insert_many(records) == 4
+    assert not db.connection.in_transaction
+
+    rows = db.tables.book.list()
+    assert [(row["title"], row["pages"]) for row in rows] == [
+        ("Dune", 412), ("Emma", 474), ("Ulysses", 0), ("1984", 328)
+    ]
+    assert [record["id"] for record in records] == [row["id"] for row in rows]
+
+
+def test_insert_many_sets_autoincrement_keys(db):
+    """Database-generated keys are set in the records before trigger_onInserted."""
+    inserted = []
+
+    class TrackedBookTable(BookTable):
+        name = "tracked"
+
+        def trigger_onInserted(self, record=None):
+            inserted.append(record.get("id"))
+
+    db.add_table(TrackedBookTable)
+    table = db.tables.tracked
+    records = [{"title": "Dune"}, {"title": "Emma"}, {"id": 10, "title": "Ulysses"}]
+
+    assert table.insert_many(records) == 3
+    assert inserted == [1, 2, 10]
+    assert table.get(2)["title"] == "Emma"
+
+
+def test_insert_many_rolls_back_on_error(db):
+    """A failing record leaves none of the batch in the table."""
+    records = [{"id": 1, "title": "Dune"}, {"id": 1, "title": "Emma"}]
+
+    with pytest.raises(Exception):
+        db.adapter.insert_many(db.tables.book, records)
+
+    assert db.tables.book.list() == []
+
+
+def test_write_statements_compiled_once(db, monkeypatch):
+    """INSERT/UPDATE/DELETE SQL is compiled once per table and field names."""
+    table = db.tables.book
+    compiler = db.adapter.get_compiler(table)
+    assert db.adapter.get_compiler(table) is compiler
+
+    pk = table.insert(record={"title": "Dune", "pages": 412})
+    table.update(record={"id": pk, "title": "Dune", "pages": 500})
+    table.delete(record={"id": pk})
+
+    for name in ("compile_insert", "compile_update", "compile_delete"):
+        monkeypatch.setattr(type(compiler), name, lambda *args: pytest.fail("recompiled"))
+
+    pk = table.insert(record={"title": "Emma", "pages": 474})
+    table.update(record={"id": pk, "title": "Emma", "pages": 475})
+    assert table.get(pk)["pages"] == 475
+    table.delete(record={"id": pk})
+    assert table.list() == []
+
+
+@pytest.mark.parametrize("dtype, size, expected", [
+    ("C", 5, "CHAR(5)"),
+    ("C", "1:10", "VARCHAR(10)"),
+    ("T", "1:20", "VARCHAR(20)"),
+    ("T", 30, "VARCHAR(30)"),
+    ("N", "10,2", "NUMERIC(10,2)"),
+    ("N", 10, None),
+    ("L", 8, None),
+    ("T", None, None),
+])
+def test_column_sql_type_size(dtype, size, expected):
+    """Column SQL types apply the size format of their dtype, if any."""
+    from genro_core.lib import get_type_catalog
+    from genro_core.micro_db.column import Column
+
+    if expected is None:
+        expected = get_type_catalog().get_sql_type(dtype)
+    assert Column("code", dtype, size=size).sql_type == expected
+
+
+def test_adapter_python_type_to_sql(db):
+    """Adapters apply the size format of the Python type."""
+    from decimal import Decimal
+
+    adapter = db.adapter
+    assert adapter.python_type_to_sql(str, 5) == "CHAR(5)"
+    assert adapter.python_type_to_sql(str, "1:10") == "VARCHAR(10)"
+    assert adapter.python_type_to_sql(Decimal, "10,2") == "NUMERIC(10,2)"
+    assert adapter.python_type_to_sql(int, 8) == "INTEGER"
+
+
+def test_column_has_no_instance_dict():
+    """Columns store their attributes in slots."""
+    from genro_core.micro_db.column import Column
+
+    column = Column("title", "T", size="1:20", name_long="Title")
+    assert not hasattr(column, "__dict__")
+    assert column.to_dict()["name_long"] == "Title"
+
+
+def test_desired_schema_cached_until_columns_change(db):
+    """The desired schema is rebuilt only after columns are added."""
+    table = db.tables.book
+    schema = db.adapter._get_desired_schema(table)
+    create_sql = db.adapter._generate_create_table_sql(table)
+    assert db.adapter._get_desired_schema(table) is schema
+    assert db.adapter._generate_create_table_sql(table) is create_sql
+
+    table.add_column("isbn", dtype="T", size="1:20")
+    changed = db.adapter._get_desired_schema(table)
+    assert changed is not schema
+    assert changed["isbn"]["sql_type"] == "VARCHAR(20)"
+    assert db.adapter._generate_create_table_sql(table).endswith(", isbn VARCHAR(20))")
+
+    assert db.migrate() == {"book": ["ALTER TABLE books ADD COLUMN isbn VARCHAR(20)"]}
+    assert db.migrate() == {}
+
+
+def test_column_types_resolved_once():
+    """python_type and sql_type are computed on first access, then stored."""
+    from genro_core.micro_db.column import Column
+
+    column = Column("code", "C", size=3)
+    assert column.sql_type == "CHAR(3)"
+    assert Column.sql_type.__get__(column) == "CHAR(3)"
+    assert column.python_type is str
+
+    with pytest.raises(AttributeError):
+        column.missing
+
+
+def test_postgres_adds_columns_in_one_statement():
+    """PostgreSQL combines missing columns into a single ALTER TABLE."""
+    from genro_core.micro_db.adapters import PostgreSQLAdapter
+
+    class RecordingCursor:
+        def __init__(self):
+            self.statements = []
+
+        def execute(self, sql, params=None):
+            self.statements.append(sql)
+
+    cursor = RecordingCursor()
+    clauses = ["ADD COLUMN isbn VARCHAR(20)", "ADD COLUMN year BIGINT DEFAULT 0"]
+
+    migrations = PostgreSQLAdapter()._execute_add_columns(cursor, "books", clauses)
+
+    expected = "ALTER TABLE books ADD COLUMN isbn VARCHAR(20), ADD COLUMN year BIGINT DEFAULT 0"
+    assert migrations == cursor.statements == [expected]
+
+
+def test_migrate_reads_schemas_once(db, monkeypatch):
+    """Database migration reads existing tables and schemas in one batch."""
+
+    class ShelfTable(Table):
+        sql_name = "shelves"
+
+        @dataclass
+        class Columns:
+            id: int
+            code: str
+
+    db.add_table(ShelfTable)
+    db.tables.book.add_column("isbn", dtype="T", size="1:20")
+
+    adapter = db.adapter
+    calls = []
+    get_current_schemas = adapter.get_current_schemas
+    monkeypatch.setattr(
+        adapter, "get_current_schemas",
+        lambda cursor, names: calls.append(sorted(names)) or get_current_schemas(cursor, names),
+    )
+
+    results = db.migrate()
+
+    assert calls == [["books"]]
+    assert results["book"] == ["ALTER TABLE books ADD COLUMN isbn VARCHAR(20)"]
+    assert results["shelf"][0].startswith("CREATE TABLE IF NOT EXISTS shelves")
+    assert not db.connection.in_transaction
+
+
+@pytest.mark.parametrize("supports_drop", [True, False])
+def test_sqlite_drop_columns(db, supports_drop):
+    """Extra columns are dropped in place, or by rebuilding the table."""
+    table = db.tables.book
+    db.adapter._supports_drop = supports_drop
+    table.insert(record={"title": "Dune", "pages": 412})
+    with db.cursor() as cursor:
+        cursor.execute("ALTER TABLE books ADD COLUMN notes TEXT")
+
+    migrations = table.migrate(drop_columns=True)
+
+    if supports_drop:
+        assert migrations == ["ALTER TABLE books DROP COLUMN notes"]
+    else:
+        assert migrations[-1] == "ALTER TABLE books_temp RENAME TO books"
+    assert table.list() == [{"id": 1, "title": "Dune", "pages": 412}]
+
+
+def test_transaction_commits_once(db, monkeypatch):
+    """Writes inside transaction() are committed on exit, or rolled back."""
+    table = db.tables.book
+    commits = []
+    connection = db.connection
+    monkeypatch.setattr(db, "_connection", type("Conn", (), {
+        "cursor": connection.cursor,
+        "commit": lambda self: commits.append(True) or connection.commit(),
+        "rollback": lambda self: connection.rollback(),
+    })())
+
+    with db.adapter.transaction(table):
+        for title in ("Dune", "Emma", "Ulysses"):
+            table.insert(record={"title": title})
+        with db.adapter.transaction(table):
+            table.update(record={"id": 1, "title": "Dune", "pages": 412})
+        assert commits == []
+
+    assert commits == [True]
+
+    with pytest.raises(RuntimeError):
+        with db.adapter.transaction(table):
+            table.delete(record={"id": 1})
+            raise RuntimeError("abort")
+
+    assert [row["title"] for row in table.list()] == ["Dune", "Emma", "Ulysses"]
+
+
+def test_update_many(db, monkeypatch):
+    """Records are updated with one CASE statement per batch of same fields."""
+    table = db.tables.book
+    table.insert_many([{"title": title, "pages": 100} for title in ("A", "B", "C", "D")])
+    monkeypatch.setattr(db.adapter, "max_params", 5)  # two records per statement
+
+    # The adapter keeps the last record of a repeated primary key
+    updated = db.adapter.update_many(table, [
+        {"id": 1, "pages": 101},
+        {"id": 2, "pages": 102},
+        {"id": 3, "pages": 999},
+        {"id": 3, "pages": 103},
+        {"id": 4, "title": "d", "pages": 104},
+        {"id": 5, "pages": 105},
+    ])
+
+    assert updated == 4
+    assert [(row["title"], row["pages"]) for row in table.list()] == [
+        ("A", 101), ("B", 102), ("C", 103), ("d", 104)
+    ]
+    assert not db.connection.in_transaction
+
+
+def test_update_many_triggers_get_stored_records(db):
+    """Table.update_many passes stored records to triggers and rejects repeated keys."""
+    calls = []
+
+    class TrackedBookTable(BookTable):
+        name = "tracked"
+
+        def trigger_onUpdating(self, record=None, oldRecord=None):
+            calls.append(("updating", record["id"], oldRecord and oldRecord["pages"]))
+
+        def trigger_onUpdated(self, record=None, oldRecord=None):
+            calls.append(("updated", record["id"], oldRecord and oldRecord["pages"]))
+
+    db.add_table(TrackedBookTable)
+    table = db.tables.tracked
+    table.insert_many([{"title": "A", "pages": 10}, {"title": "B", "pages": 20}])
+
+    assert table.update_many([{"id": 2, "pages": 21}, {"id": 9, "pages": 90}]) == 1
+    assert calls == [
+        ("updating", 2, 20), ("updating", 9, None), ("updated", 2, 20), ("updated", 9, None)
+    ]
+
+    with pytest.raises(ValueError, match="Duplicate primary key"):
+        table.update_many([{"id": 1, "pages": 11}, {"id": 1, "pages": 12}])
+    assert table.get(1)["pages"] == 10
+
+
+def test_string_defaults_are_quoted(db):
+    """Quotes in string defaults do not break the generated DDL."""
+    table = db.tables.book
+    table.add_column("author", dtype="T", default="O'Brien")
+    table.add_column("available", dtype="B", default=True)
+    db.migrate()
+
+    table.insert({"title": "A"})
+    row = table.list()[0]
+    assert (row["author"], row["available"]) == ("O'Brien", 1)
+    assert db.adapter._format_default("x'); DROP TABLE books; --") == "'x''); DROP TABLE books; --'"
+
+
+def test_migrate_unchanged_schema_is_noop(db, monkeypatch):
+    """Tables whose columns match the definition produce no statements."""
+    monkeypatch.setattr(
+        db.adapter, "_format_add_column_clause", lambda *args: pytest.fail("diffed")
+    )
+
+    assert db.migrate(drop_columns=True) == {}
+    columns = db.connection.execute("PRAGMA table_info(books)").fetchall()
+    assert [column["name"] for column in columns] == ["id", "title", "pages"]
+
+
+def test_select_sql_cached_per_clauses(db, monkeypatch):
+    """SELECT statements are compiled once per combination of clauses."""
+    compiler = db.adapter.get_compiler(db.tables.book)
+    sql, params = compiler.compile_select(
+        columns="$title, $pages", where="$pages > :p", order_by="$title", p=100
+    )
+    assert sql == "SELECT title, pages FROM books WHERE pages > :p ORDER BY title"
+    assert params == {"p": 100}
+
+    monkeypatch.setattr(type(compiler), "_build_select", lambda *args: pytest.fail("recompiled"))
+    again, params = compiler.compile_select(
+        columns="$title, $pages", where="$pages > :p", order_by="$title", p=200
+    )
+    assert again is sql
+    assert params == {"p": 200}
+
+
+def test_select_clauses_and_params(db):
+    """Only SELECT clause names are taken as clauses; other keywords are parameters."""
+    compiler = db.adapter.get_compiler(db.tables.book)
+    sql, params = compiler.compile_select(
+        where="$title = :insert", limit=5, offset=10, group_by="$title", insert="A"
+    )
+
+    assert sql == "SELECT * FROM books WHERE title = :insert GROUP BY title LIMIT 5 OFFSET 10"
+    assert params == {"insert": "A"}
+    assert compiler.compile_select(p=1) == ("SELECT * FROM books", {"p": 1})
+
+
+def test_current_env_is_thread_local(db):
+    """Each thread sees its own environment dictionary."""
+    import threading
+
+    db.currentEnv["audit_user"] = "admin"
+    seen = []
+    thread = threading.Thread(target=lambda: seen.append(dict(db.currentEnv)))
+    thread.start()
+    thread.join()
+
+    assert seen == [{}]
+    assert db.currentEnv["audit_user"] == "admin"
+    del db.currentEnv["audit_user"]
+
+
+def test_supporting_classes_use_slots(db):
+    """Registry, tempEnv and compiler instances have no __dict__."""
+    compiler = db.adapter.get_compiler(db.tables.book)
+
+    for instance in (db.tables, db.tempEnv(audit_user="admin"), compiler):
+        assert not hasattr(instance, "__dict__")
+
+
+def test_tables_registry_attribute_access(db):
+    """Tables are attributes of the registry; misses raise AttributeError."""
+    assert db.tables.book is db.tables["book"]
+
+    with pytest.raises(AttributeError, match="Table 'shelf' not found"):
+        db.tables.shelf
+    with pytest.raises(AttributeError, match="no attribute '_private'"):
+        db.tables._private
+
+
+def test_tables_registry_copy_and_pickle(db):
+    """Registries survive copy and pickle, which build instances via __new__."""
+    import copy
+    import pickle
+    from types import SimpleNamespace
+
+    from genro_core.micro_db import TablesRegistry
+
+    assert copy.copy(db.tables).book is db.tables.book
+
+    registry = TablesRegistry()
+    registry.register(SimpleNamespace(name="shelf", sql_name="shelves"))
+    restored = pickle.loads(pickle.dumps(registry))
+    assert restored.shelf.sql_name == "shelves"
+
+
+@pytest.mark.parametrize("params", [
+    {"connection_string": "sqlite:///:memory:"},
+    {"connection_string": "sqlite://"},
+    {"implementation": "sqlite"},
+])
+def test_connection_parameters_resolved_once(params, monkeypatch):
+    """Connection strings are parsed at construction, not by connection or adapter."""
+    from genro_core.micro_db import database
+
+    db = GenroMicroDb(name="test_db", **params)
+    monkeypatch.setattr(database, "urlparse", lambda url: pytest.fail("parsed again"))
+
+    assert db._resolved_path == ":memory:"
+    assert db.connection.execute("SELECT 1").fetchone()[0] == 1
+    assert type(db.adapter).__name__ == "SQLiteAdapter"
+    db.close()
+
+
+def test_cursor_closed_on_exit(db):
+    """Cursors are closed when the with block exits, also on errors."""
+    import sqlite3
+
+    with pytest.raises(ZeroDivisionError):
+        with db.tables.book.cursor() as cursor:
+            cursor.execute("SELECT 1")
+            1 / 0
+
+    with pytest.raises(sqlite3.ProgrammingError, match="closed cursor"):
+        cursor.execute("SELECT 1")
+
+
+def test_migrate_calls_table_overrides(db, monkeypatch):
+    """Database migration goes through each table's migrate(), with prefetched state."""
+    seen = []
+
+    class AuditTable(Table):
+        sql_name = "audits"
+
+        @dataclass
+        class Columns:
+            id: int
+            action: str
+
+        def migrate(self, drop_columns: bool = False) -> list[str]:
+            seen.append(self.db.adapter._prefetched.get(self.sql_name))
+            return super().migrate(drop_columns=drop_columns) + ["-- audited"]
+
+    db.add_table(AuditTable)
+    queried = []
+    table_exists = db.adapter._table_exists
+    monkeypatch.setattr(
+        db.adapter, "_table_exists",
+        lambda cursor, name: queried.append(name) or table_exists(cursor, name),
+    )
+
+    results = db.migrate()
+
+    assert sorted(queried) == ["audits", "books"]
+    assert seen == [(False, None)]
+    assert results["audit"][-1] == "-- audited"
+    assert "book" not in results
+    assert db.adapter._prefetched == {}
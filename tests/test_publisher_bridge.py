@@ -0,0 +1,510 @@
+"""Tests for PublisherBridge structure caching and output formats."""
+
+import json
+import sys
+
+import pytest
+
+from genro_core.enablers import apiready, PublisherBridge
+
+
+@apiready(path="/books")
+class BookApi:
+    """Books API."""
+
+    @apiready
+    def list_books(self, genre: str = "fiction") -> list[dict]:
+        """List books."""
+        return []
+
+    @apiready(transaction=True)
+    def add(self, title: str, pages: int = 10) -> dict:
+        """Add a book."""
+        return {}
+
+
+@apiready(path="/shelves")
+class ShelfApi:
+    """Shelves API."""
+
+    @apiready
+    def has_room(self) -> bool:
+        return True
+
+
+@pytest.fixture
+def bridge():
+    PublisherBridge.clear_cache()
+    yield PublisherBridge(app=None)
+    PublisherBridge.clear_cache()
+
+
+def test_class_structure_is_cached(bridge):
+    """Repeated calls on a class reuse the cached structure, returned as a copy."""
+    first = bridge.get_api_structure(BookApi, mode="dict")
+    second = bridge.get_api_structure(BookApi, mode="dict")
+
+    assert first == second
+    assert first is not second
+    assert bridge._class_structure(BookApi, True) is bridge._class_structure(BookApi, True)
+    assert [e["function_name"] for e in first["endpoints"]] == ["add", "list_books"]
+
+
+def test_dict_output_can_be_modified(bridge):
+    """Changes to a returned dict don't reach the cache or the decorated methods."""
+    structure = bridge.get_api_structure(BookApi, mode="dict")
+    structure["endpoints"][0]["parameters"]["title"]["type"] = "bytes"
+    structure["children"].clear()
+
+    assert BookApi.add._api_metadata.parameters["title"]["type"] == "str"
+    assert bridge.get_api_structure(BookApi, mode="dict")["children"]
+    assert "bytes" not in bridge.get_api_structure(BookApi, mode="json")
+
+
+def test_eager_structure_follows_module_classes(bridge, monkeypatch):
+    """Eager structures list @apiready classes added to the module after the first call."""
+    first = bridge.get_api_structure(BookApi, mode="json")
+
+    monkeypatch.setitem(globals(), "LateApi", apiready(path="/late")(type("LateApi", (), {})))
+    structure = bridge.get_api_structure(BookApi, mode="dict")
+
+    assert "LateApi" in [c["class_name"] for c in structure["children"]]
+    assert "LateApi" in bridge.get_api_structure(BookApi, mode="json")
+    assert "LateApi" not in first
+
+
+def test_cache_is_keyed_on_eager(bridge):
+    """Eager and lazy structures are cached separately."""
+    eager = bridge.get_api_structure(BookApi, eager=True, mode="dict")
+    lazy = bridge.get_api_structure(BookApi, eager=False, mode="dict")
+
+    assert "children" in eager
+    assert "children" not in lazy
+
+
+def test_instance_structure_reuses_class_structure(bridge):
+    """Instances get their own dict, built on the cached class structure."""
+    first = bridge.get_api_structure(BookApi(), mode="dict")
+    second = bridge.get_api_structure(BookApi(), mode="dict")
+
+    assert first is not second
+    assert first == second == bridge.get_api_structure(BookApi, mode="dict")
+    instance_structure = bridge._instance_structure(BookApi(), True)
+    assert instance_structure["endpoints"] is bridge._class_structure(BookApi, True)["endpoints"]
+
+
+def test_clear_cache(bridge):
+    """clear_cache() forces the structure to be rebuilt."""
+    first = bridge._class_structure(BookApi, True)
+    PublisherBridge.clear_cache()
+
+    assert bridge._class_structure(BookApi, True) is not first
+
+
+def test_json_output_matches_dict(bridge):
+    """JSON output serializes the same structure returned in dict mode."""
+    structure = bridge.get_api_structure(ShelfApi, eager=False, mode="dict")
+
+    assert json.loads(bridge.get_api_structure(ShelfApi, eager=False)) == structure
+
+
+def test_formatted_output_is_cached(bridge):
+    """Formatted outputs are cached per (class, eager, mode)."""
+    first = bridge.get_api_structure(BookApi, mode="markdown")
+
+    assert bridge.get_api_structure(BookApi, mode="markdown") is first
+    assert bridge.get_api_structure(BookApi, mode="MARKDOWN") is first
+    assert bridge.get_api_structure(BookApi, eager=False, mode="markdown") is not first
+
+
+def test_inherited_and_overridden_endpoints(bridge):
+    """Endpoints are collected along the MRO; overrides shadow base methods."""
+
+    @apiready(path="/novels")
+    class NovelApi(BookApi):
+        def add(self, title: str) -> dict:
+            """Not exposed: overrides the decorated base method."""
+            return {}
+
+        @apiready
+        def get_author(self, title: str) -> str:
+            return ""
+
+    structure = bridge.get_api_structure(NovelApi, eager=False, mode="dict")
+
+    assert [e["function_name"] for e in structure["endpoints"]] == [
+        "get_author", "list_books"
+    ]
+
+
+def test_sorted_endpoints_stored_on_class(bridge):
+    """Sorted endpoints are computed once per class and dropped by clear_cache()."""
+    bridge.get_api_structure(BookApi(), eager=False, mode="dict")
+    endpoints = BookApi.__dict__["_api_sorted_endpoints"]
+
+    assert [e.path for e in endpoints] == ["/add", "/list_books"]
+    bridge.get_api_structure(BookApi(), eager=False, mode="dict")
+    assert BookApi.__dict__["_api_sorted_endpoints"] is endpoints
+
+    PublisherBridge.clear_cache()
+    assert "_api_sorted_endpoints" not in BookApi.__dict__
+
+
+def test_parameters_rendered_at_decoration(bridge):
+    """Parameter lists of decorated methods are rendered once and reused."""
+    rendered = BookApi.add._api_metadata.rendered_parameters
+    assert rendered == "title str, pages int=10"
+
+    markdown = bridge.get_api_structure(BookApi, mode="md")
+    endpoint = next(e for e in BookApi._api_sorted_endpoints if e.function_name == "add")
+    assert endpoint.rendered_parameters is rendered
+    assert f"Parameters: {rendered}" in markdown
+
+
+def test_module_classes_found_in_namespace(bridge, monkeypatch):
+    """Module-level @apiready classes are found by scanning the module namespace."""
+    from genro_core.enablers import api_publisher_enabler
+
+    structure = bridge.get_api_structure(BookApi, mode="dict")
+    assert "ShelfApi" in [c["class_name"] for c in structure["children"]]
+
+    # Classes decorated inside functions are not module members
+    @apiready(path="/local")
+    class LocalApi:
+        pass
+
+    classes = api_publisher_enabler._module_apiready_classes(__name__)
+    assert classes[:2] == (BookApi, ShelfApi)
+    assert LocalApi not in classes
+
+    monkeypatch.setitem(globals(), "ExtraApi", apiready(path="/extra")(type("ExtraApi", (), {})))
+    assert ExtraApi in api_publisher_enabler._module_apiready_classes(__name__)
+
+
+def test_module_classes_include_subclasses_and_imports(bridge, monkeypatch):
+    """Undecorated subclasses and imported @apiready classes are module classes too."""
+    import types
+    from genro_core.enablers import api_publisher_enabler
+
+    module = types.ModuleType("fake_api_module")
+    module.BookApi = BookApi  # imported from another module
+    module.NovelApi = type("NovelApi", (BookApi,), {"__module__": module.__name__})
+    module.Slot = None
+    monkeypatch.setitem(sys.modules, module.__name__, module)
+
+    classes = api_publisher_enabler._module_apiready_classes(module.__name__)
+    assert classes == (BookApi, module.NovelApi)
+
+    structure = bridge.get_api_structure(module.NovelApi, mode="dict")
+    assert [c["class_name"] for c in structure["children"]] == ["BookApi"]
+
+    # Decorating a class of the module rescans it, also when it rebinds a name
+    module.Slot = apiready(path="/slot")(type("Slot", (), {"__module__": module.__name__}))
+    assert api_publisher_enabler._module_apiready_classes(module.__name__)[-1] is module.Slot
+
+
+def test_module_classes_scan_fallback(bridge, monkeypatch):
+    """Module namespaces are scanned once, then on changes."""
+    import types
+    from genro_core.enablers import api_publisher_enabler
+
+    module = types.ModuleType("fake_api_module")
+    module.ManualApi = type("ManualApi", (), {"_api_base_path": "/manual"})
+    monkeypatch.setitem(sys.modules, module.__name__, module)
+
+    classes = api_publisher_enabler._module_apiready_classes(module.__name__)
+    assert classes == (module.ManualApi,)
+    cached = api_publisher_enabler._module_apiready_cache[module.__name__]
+    assert api_publisher_enabler._module_apiready_classes(module.__name__) == classes
+    assert api_publisher_enabler._module_apiready_cache[module.__name__] is cached
+
+    # New module names trigger a rescan
+    module.OtherApi = type("OtherApi", (), {"_api_base_path": "/other"})
+    assert module.OtherApi in api_publisher_enabler._module_apiready_classes(module.__name__)
+
+    # So do classes replaced by a reload, and a new module under the same name
+    module.ManualApi = type("ManualApi", (), {"_api_base_path": "/manual"})
+    assert module.ManualApi in api_publisher_enabler._module_apiready_classes(module.__name__)
+
+    reimported = types.ModuleType(module.__name__)
+    reimported.ManualApi = module.ManualApi
+    monkeypatch.setitem(sys.modules, module.__name__, reimported)
+    assert api_publisher_enabler._module_apiready_classes(module.__name__) == (module.ManualApi,)
+
+    PublisherBridge.reload_module_cache(module.__name__)
+    assert module.__name__ not in api_publisher_enabler._module_apiready_cache
+
+
+def test_module_classes_include_tables_once_instantiated(bridge, monkeypatch):
+    """Table subclasses already scanned are listed once Table.__init__ sets their path."""
+    import types
+    from dataclasses import dataclass
+
+    from genro_core import GenroMicroDb, Table
+    from genro_core.enablers import api_publisher_enabler
+
+    module = types.ModuleType("fake_api_module")
+    module.ManualApi = type("ManualApi", (), {"_api_base_path": "/manual"})
+
+    @dataclass
+    class Columns:
+        id: int
+
+    module.ReaderTable = type(
+        "ReaderTable", (Table,),
+        {"__module__": module.__name__, "sql_name": "readers", "Columns": Columns},
+    )
+    monkeypatch.setitem(sys.modules, module.__name__, module)
+
+    assert api_publisher_enabler._module_apiready_classes(module.__name__) == (module.ManualApi,)
+
+    db = GenroMicroDb(name="test_db", implementation="sqlite", path=":memory:")
+    db.add_table(module.ReaderTable)
+    assert api_publisher_enabler._module_apiready_classes(module.__name__) == (
+        module.ManualApi, module.ReaderTable
+    )
+
+
+def test_json_output_without_orjson(bridge, monkeypatch):
+    """The json module fallback produces the same document as orjson."""
+    from genro_core.enablers import api_publisher_enabler
+
+    expected = bridge.get_api_structure(BookApi, mode="json")
+    PublisherBridge.clear_cache()
+    monkeypatch.setattr(api_publisher_enabler, "orjson", None)
+
+    assert json.loads(bridge.get_api_structure(BookApi, mode="json")) == json.loads(expected)
+
+
+@pytest.mark.parametrize("backend", ["orjson", "json"])
+def test_json_values_rendered_with_str(bridge, monkeypatch, backend):
+    """Both JSON backends write dates, times and Enum defaults with str()."""
+    from datetime import date, datetime
+    from enum import Enum
+
+    from genro_core.enablers import api_publisher_enabler
+
+    if backend == "orjson":
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(api_publisher_enabler, "orjson", None)
+    monkeypatch.setattr(api_publisher_enabler, "_enum_defaults", False)
+
+    dates = {"at": datetime(2024, 1, 2, 3, 4), "on": date(2024, 1, 2)}
+    assert api_publisher_enabler._dump_json(dates) == json.dumps(dates, indent=2, default=str)
+
+    class Shade(Enum):
+        DARK = "dark"
+
+    @apiready(path="/events")
+    class EventApi:
+        @apiready
+        def list_events(
+            self,
+            since: datetime = datetime(2024, 1, 2, 3, 4),
+            day: date = date(2024, 1, 2),
+            shade: Shade = Shade.DARK,
+        ) -> list:
+            return []
+
+    structure = bridge.get_api_structure(EventApi, eager=False, mode="dict")
+    expected = json.dumps(structure, indent=2, default=str)
+
+    assert json.loads(bridge.get_api_structure(EventApi, eager=False)) == json.loads(expected)
+    assert json.loads(bridge.get_api_structure(EventApi, eager=False, mode="json-bytes")) == (
+        json.loads(expected)
+    )
+    defaults = json.loads(expected)["endpoints"][0]["parameters"]
+    assert [defaults[name]["default"] for name in ("since", "day", "shade")] == [
+        "2024-01-02 03:04:00", "2024-01-02", "Shade.DARK"
+    ]
+
+
+def test_instance_managers_and_failing_properties(bridge):
+    """Eager instance walk finds managers and skips properties that raise."""
+
+    @apiready(path="/library")
+    class LibraryApi:
+        def __init__(self):
+            self.books = BookApi()
+
+        @property
+        def broken(self):
+            raise RuntimeError("not available")
+
+        @property
+        def shelves(self):
+            return ShelfApi()
+
+    structure = bridge.get_api_structure(LibraryApi(), mode="dict")
+    names = [child["class_name"] for child in structure["children"]]
+
+    assert names[:2] == ["BookApi", "ShelfApi"]
+
+
+def test_multi_json_matches_json_dumps(bridge):
+    """Streamed multi-target JSON is the document json.dumps(indent=2) gives."""
+    targets = [BookApi, ShelfApi(), ShelfApi]
+    structures = bridge.get_api_structure_multi(targets, mode="dict")
+
+    assert bridge.get_api_structure_multi(targets) == json.dumps(structures, indent=2, default=str)
+    assert bridge.get_api_structure_multi([]) == "[]"
+
+
+@apiready(path="/loans")
+class LoanApi:
+    """Loans API, referencing a type defined after it."""
+
+    @apiready
+    def get_loan(self, loan_id: "LoanId") -> "Loan":
+        return None
+
+
+def test_forward_references_resolved_on_introspection(bridge):
+    """Hints unresolved at decoration are resolved once the names exist."""
+    metadata = LoanApi.get_loan._api_metadata
+    assert metadata.pending_hints is not None
+
+    global Loan, LoanId
+
+    class Loan:
+        pass
+
+    LoanId = int
+    try:
+        structure = bridge.get_api_structure(LoanApi, eager=False, mode="dict")
+    finally:
+        del Loan, LoanId
+
+    endpoint = structure["endpoints"][0]
+    assert endpoint["parameters"]["loan_id"]["type"] == "int"
+    assert endpoint["return_type"] == {"type": "Loan"}
+    assert LoanApi.get_loan._api_metadata.pending_hints is None
+    assert LoanApi.get_loan._api_metadata.return_type.__name__ == "Loan"
+    assert LoanApi.get_loan._api_metadata.rendered_parameters == "loan_id int"
+
+
+def test_structure_cached_on_first_introspection():
+    """The structure of a class is built once, on first introspection."""
+
+    @apiready(path="/authors")
+    class AuthorApi:
+        @apiready
+        def list_authors(self) -> list:
+            return []
+
+    assert "_api_structure_cached" not in AuthorApi.__dict__
+
+    structure = PublisherBridge(app=None)._class_structure(AuthorApi, False)
+    cached = AuthorApi.__dict__["_api_structure_cached"]
+    assert [e["function_name"] for e in cached["endpoints"]] == ["list_authors"]
+    assert structure == cached
+    assert structure["endpoints"] is cached["endpoints"]
+
+
+def test_table_structure_has_crud_items():
+    """additem/delitem set by Table.__init__ after decoration are reported."""
+    from dataclasses import dataclass
+
+    from genro_core import GenroMicroDb, Table
+
+    @apiready(path="/authors")
+    class AuthorTable(Table):
+        sql_name = "authors"
+
+        @dataclass
+        class Columns:
+            id: int
+            name: str
+
+    db = GenroMicroDb(name="test_db", implementation="sqlite", path=":memory:")
+    db.add_table(AuthorTable)
+
+    structure = PublisherBridge(app=None).get_api_structure(AuthorTable, eager=False, mode="dict")
+    assert structure["additem"] == "add"
+    assert structure["delitem"] == "delete"
+
+
+def test_only_functions_are_endpoints(bridge):
+    """Static methods are endpoints, class methods and other callables are not."""
+
+    class Tool:
+        def __call__(self):
+            pass
+
+    tool = Tool()
+    tool._api_metadata = BookApi.add._api_metadata
+
+    @apiready(path="/tools")
+    class ToolApi:
+        callable_attr = tool
+
+        @staticmethod
+        @apiready
+        def get_version() -> str:
+            return "1"
+
+        @classmethod
+        @apiready
+        def get_kind(cls) -> str:
+            return "tool"
+
+    structure = bridge.get_api_structure(ToolApi, eager=False, mode="dict")
+    assert [e["function_name"] for e in structure["endpoints"]] == ["get_version"]
+
+
+def test_declared_subcomponents(bridge):
+    """Only declared subcomponents are read, in declaration order."""
+
+    @apiready(path="/store", subcomponents=("shelves", "books", "missing"))
+    class StoreApi:
+        def __init__(self):
+            self.books = BookApi()
+            self.shelves = ShelfApi()
+
+        @property
+        def undeclared(self):
+            raise AssertionError("undeclared attributes must not be read")
+
+    assert StoreApi._api_subcomponents == ("shelves", "books", "missing")
+
+    structure = bridge.get_api_structure(StoreApi(), mode="dict")
+    names = [child["class_name"] for child in structure["children"]]
+    assert names[:2] == ["ShelfApi", "BookApi"]
+
+
+def test_yaml_output_is_safe(bridge):
+    """YAML output loads with safe_load; non-YAML defaults are written as strings."""
+    yaml = pytest.importorskip("yaml")
+
+    class Marker:
+        def __str__(self):
+            return "marker"
+
+    @apiready(path="/marks")
+    class MarkApi:
+        @apiready
+        def add(self, mark=Marker(), span: tuple = (1, 2)) -> None:
+            pass
+
+    loaded = yaml.safe_load(bridge.get_api_structure(MarkApi, eager=False, mode="yaml"))
+    parameters = loaded["endpoints"][0]["parameters"]
+
+    assert parameters["mark"]["default"] == "marker"
+    assert parameters["span"]["default"] == [1, 2]
+
+
+def test_bytes_modes(bridge):
+    """json-bytes and yaml-bytes return the encoded json and yaml documents."""
+    pytest.importorskip("yaml")
+    targets = [BookApi, ShelfApi()]
+
+    for mode in ("json", "yaml"):
+        encoded = bridge.get_api_structure(BookApi, mode=f"{mode}-bytes")
+        assert isinstance(encoded, bytes)
+        assert encoded == bridge.get_api_structure(BookApi, mode=mode).encode()
+
+        multi = bridge.get_api_structure_multi(targets, mode=f"{mode}-bytes")
+        assert multi == bridge.get_api_structure_multi(targets, mode=mode).encode()
+
+    assert bridge.get_api_structure_multi([], mode="json-bytes") == b"[]"